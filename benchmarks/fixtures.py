@@ -0,0 +1,135 @@
+"""Deterministic synthetic directory trees for the tree view examples and benchmarks.
+
+The same spec and seed always produce the same folders and file names, so scaling
+measurements can be repeated on any machine.
+
+Usage:
+    python -m benchmarks.fixtures 100k /tmp/tree-100k
+    python -m benchmarks.fixtures 1M /tmp/tree-1m --hidden 0.1 --seed 3
+    python "tree view examples/tree example 18 with time slicing.py" /tmp/tree-100k
+"""
+import argparse
+import os
+import random
+import time
+from typing import NamedTuple
+
+# Syllables and extensions names are drawn from, with their weights
+SYLLABLES = ("ka", "lo", "mi", "ren", "to", "sa", "vel", "dor", "qu", "ix", "an", "be")
+EXTENSIONS = {".txt": 5, ".csv": 4, ".dat": 3, ".json": 2, ".png": 1, "": 1}
+
+
+class TreeSpec(NamedTuple):
+    """Shape of a generated tree.
+
+    Attributes:
+        depth (int): Levels of folders below the root.
+        fanout (int): Sub folders of every folder above the last level.
+        files (int): Files in every folder, the root included.
+        hidden (float): Fraction of files and folders whose name starts with a dot.
+        syllables (tuple): Minimum and maximum number of syllables of a name.
+        spaces (float): Fraction of names with a space between syllables.
+        seed (int): Seed of the name generator.
+    """
+
+    depth: int
+    fanout: int
+    files: int
+    hidden: float = 0.05
+    syllables: tuple[int, int] = (1, 4)
+    spaces: float = 0.1
+    seed: int = 0
+
+    def entries(self) -> int:
+        """Returns the number of files and folders the tree has, root excluded."""
+        folders = sum(self.fanout**level for level in range(1, self.depth + 1))
+        return folders + (folders + 1) * self.files
+
+
+# Entry counts of the presets: 1022, 99_989 and 999_989
+PRESETS = {
+    "1k": TreeSpec(depth=2, fanout=5, files=32),
+    "100k": TreeSpec(depth=3, fanout=10, files=89),
+    "1M": TreeSpec(depth=4, fanout=10, files=89),
+}
+
+
+class TreeStats(NamedTuple):
+    folders: int
+    files: int
+    hidden: int
+    seconds: float
+
+
+def _name(rng: random.Random, spec: TreeSpec, index: int) -> str:
+    """Returns a random name, made unique within its folder by `index`."""
+    count = rng.randint(*spec.syllables)
+    separator = " " if rng.random() < spec.spaces else ""
+    stem = separator.join(rng.choice(SYLLABLES) for _ in range(count))
+    if rng.random() < 0.3:
+        stem = stem.capitalize()
+    prefix = "." if rng.random() < spec.hidden else ""
+    return f"{prefix}{stem}_{index:04}"
+
+
+def generate(path: str, spec: TreeSpec) -> TreeStats:
+    """Creates the tree described by `spec` in the directory `path`.
+
+    `path` is created if needed and must not contain a previously generated tree.
+    Files are empty; the tree views only look at names and metadata.
+    """
+    started = time.perf_counter()
+    rng = random.Random(spec.seed)
+    extensions = list(EXTENSIONS)
+    weights = list(EXTENSIONS.values())
+    folders = files = hidden = 0
+
+    os.makedirs(path, exist_ok=True)
+    stack = [(path, 0)]
+    while stack:
+        folder, level = stack.pop()
+        for index in range(spec.files):
+            name = _name(rng, spec, index) + rng.choices(extensions, weights)[0]
+            with open(os.path.join(folder, name), "x"):
+                pass
+            files += 1
+            hidden += name.startswith(".")
+        if level < spec.depth:
+            for index in range(spec.fanout):
+                # Numbered after the files, an extensionless file may have the same stem
+                name = _name(rng, spec, spec.files + index)
+                os.mkdir(os.path.join(folder, name))
+                stack.append((os.path.join(folder, name), level + 1))
+                folders += 1
+                hidden += name.startswith(".")
+
+    return TreeStats(folders, files, hidden, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("preset", choices=PRESETS, help="size of the tree")
+    parser.add_argument("path", help="directory to create the tree in")
+    parser.add_argument("--depth", type=int)
+    parser.add_argument("--fanout", type=int)
+    parser.add_argument("--files", type=int, help="files per folder")
+    parser.add_argument("--hidden", type=float, help="fraction of hidden names")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    overrides = {
+        field: getattr(args, field)
+        for field in ("depth", "fanout", "files", "hidden", "seed")
+        if getattr(args, field) is not None
+    }
+    spec = PRESETS[args.preset]._replace(**overrides)
+    print(f"Generating {spec.entries()} entries in {args.path}")
+    stats = generate(args.path, spec)
+    print(
+        f"{stats.folders} folders, {stats.files} files, {stats.hidden} hidden "
+        f"in {stats.seconds:.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
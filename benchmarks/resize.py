@@ -0,0 +1,55 @@
+"""Resize latency of the root window against the number of built frames.
+
+Compares the "raise" and "unmap" switch modes of `View`. Every frame is a sign up
+form, so the geometry manager has the same amount of work per frame as in the app.
+
+Usage:
+    python -m benchmarks.resize --frames 1 10 50 100 --steps 100
+"""
+import argparse
+import statistics
+import time
+
+from views.init_view import View
+from views.signup import SignUpView
+
+
+def measure(frame_count: int, switch_mode: str, steps: int) -> list[float]:
+    """Returns the time in seconds of every resize, from geometry change to idle."""
+    view = View(switch_mode=switch_mode)
+    for i in range(frame_count):
+        view.register_frame(f"frame{i}", SignUpView)
+        view.get_frame(f"frame{i}")
+    view.switch("frame0")
+    view.root.update()
+
+    timings = []
+    for step in range(steps):
+        width = 500 + (step % 20) * 10
+        height = 300 + (step % 20) * 5
+        start = time.perf_counter()
+        view.root.geometry(f"{width}x{height}")
+        view.root.update()
+        timings.append(time.perf_counter() - start)
+
+    view.root.destroy()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--steps", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'frames':>6}  {'mode':<6}  {'median ms':>9}  {'p95 ms':>7}")
+    for frame_count in args.frames:
+        for switch_mode in ("raise", "unmap"):
+            timings = sorted(measure(frame_count, switch_mode, args.steps))
+            median = statistics.median(timings) * 1000
+            p95 = timings[int(len(timings) * 0.95) - 1] * 1000
+            print(f"{frame_count:>6}  {switch_mode:<6}  {median:>9.2f}  {p95:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Benchmarks of the app's hot paths, compared against a stored baseline.
+
+Every case reports the median time of one operation over several repeats. Cases that
+need a display or pypubsub are skipped when those are not available.
+
+Usage:
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 0.2
+"""
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter
+from typing import Callable, Optional
+
+from .fixtures import TreeSpec, generate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TREE_EXAMPLE = os.path.join(
+    ROOT, "tree view examples", "tree example 18 with time slicing.py"
+)
+
+# Case name -> (function returning seconds per operation, requirements)
+CASES: dict[str, tuple[Callable[[], float], tuple[str, ...]]] = {}
+
+
+def case(name: str, *requires: str):
+    """Registers a benchmark case. `requires` can contain "display" and "pubsub"."""
+
+    def register(fn: Callable[[], float]) -> Callable[[], float]:
+        CASES[name] = (fn, requires)
+        return fn
+
+    return register
+
+
+def has_display() -> bool:
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        return False
+    return True
+
+
+def has_pubsub() -> bool:
+    return importlib.util.find_spec("pubsub") is not None
+
+
+def per_op(fn: Callable[[], None], count: int) -> float:
+    """Returns the mean time of one of `count` calls of `fn`."""
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count
+
+
+def _fan_out(listeners: int) -> Callable[[], float]:
+    def run() -> float:
+        from models.base import ObservableModel
+
+        model = ObservableModel()
+        for _ in range(listeners):
+            model.add_event_listener("changed", lambda model: None)
+        return per_op(lambda: model.trigger_event("changed"), 10_000)
+
+    return run
+
+
+for _listeners in (1, 10, 100):
+    case(f"trigger_event fan-out {_listeners}")(_fan_out(_listeners))
+
+
+@case("headless sign in/out")
+def headless_sign_in_out() -> float:
+    from models.init_model import Model
+    from models.passwords import hash_password
+    from models.user_store import UserStore
+    from views.headless import HeadlessView
+    from controllers.init_controller import Controller
+
+    # A minimal scrypt cost, so the case measures the app and the process pool round
+    # trip rather than the KDF
+    store = UserStore(":memory:")
+    store.add(
+        {"username": "user", "fullname": "", "password_hash": hash_password("pw", n=2)}
+    )
+    view = HeadlessView()
+    Controller(Model(store), view).start()
+
+    def cycle() -> None:
+        frame = view.get_frame("signin")
+        frame.username_input.delete(0, tkinter.END)
+        frame.username_input.insert(0, "user")
+        frame.password_input.insert(0, "pw")
+        frame.signin_btn.invoke()
+        deadline = time.monotonic() + 10
+        while view.current != "home":  # Until the worker process verified the password
+            if time.monotonic() > deadline:
+                message = view.frames["signin"].message["text"]
+                raise RuntimeError(f"Signing in did not finish: {message!r}")
+            view.root.update()
+        view.frames["home"].signout_btn.invoke()
+        view.root.drain()
+
+    return per_op(cycle, 2_000)
+
+
+@case("View.switch", "display")
+def view_switch() -> float:
+    from views.init_view import View
+
+    view = View()
+    for name in ("signin", "signup", "home"):
+        view.get_frame(name)
+    names = iter(["signin", "signup", "home"] * 1_000)
+    try:
+        return per_op(lambda: view.switch(next(names)), 3_000)
+    finally:
+        view.root.destroy()
+
+
+@case("frame construction", "display")
+def frame_construction() -> float:
+    from views.root import Root
+    from views.home import HomeView
+    from views.signin import SignInView
+    from views.signup import SignUpView
+
+    root = Root()
+
+    def build() -> None:
+        for Frame in (SignInView, SignUpView, HomeView):
+            Frame(root).destroy()
+
+    try:
+        return per_op(build, 100) / 3
+    finally:
+        root.destroy()
+
+
+def _load_tree_example():
+    spec = importlib.util.spec_from_file_location("tree_example", TREE_EXAMPLE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def _run_task(root: tkinter.Tk, task) -> None:
+    while not task.finished:
+        root.update()
+
+
+def _tree_case(operation: str) -> Callable[[], float]:
+    def run() -> float:
+        example = _load_tree_example()
+        folder = tempfile.mkdtemp()
+        root = tkinter.Tk()
+        try:
+            spec = TreeSpec(depth=1, fanout=20, files=100, hidden=0)
+            generate(folder, spec)
+            paths = sorted(
+                os.path.join(parent, name)
+                for parent, _, names in os.walk(folder)
+                for name in names
+            )
+            view = example.FileTreeView(root, folder)
+            view.runner.cancel_all()
+            view.tree.delete(*view.tree.get_children())
+
+            # Fill the tree with every folder expanded
+            start = time.perf_counter()
+            _run_task(root, view.populate_tree("", view.base_folder))
+            for node_id in view.tree.get_children():
+                _run_task(root, view.runner.spawn(view.expand_steps(node_id)))
+            populated = time.perf_counter() - start
+            if operation == "populate":
+                return populated / spec.entries()
+
+            selected = paths[::4]
+            start = time.perf_counter()
+            _run_task(root, view.select_items(selected))
+            return (time.perf_counter() - start) / len(selected)
+        finally:
+            root.destroy()
+            shutil.rmtree(folder)
+
+    return run
+
+
+case("FileTreeView.populate_tree per row", "display")(_tree_case("populate"))
+case("FileTreeView.select_items per file", "display")(_tree_case("select"))
+
+
+@case("Tab1Model update", "pubsub")
+def tab1_update() -> float:
+    # The tabbed app has its own `models` module, so it runs in a separate interpreter
+    output = subprocess.check_output(
+        [sys.executable, "-m", "benchmarks.tab1"], cwd=ROOT, text=True
+    )
+    return json.loads(output)["seconds_per_update"]
+
+
+def run(names: list[str], repeat: int) -> dict[str, Optional[float]]:
+    """Returns the median time per operation of every case, None for skipped ones."""
+    available = {"display": has_display(), "pubsub": has_pubsub()}
+    results: dict[str, Optional[float]] = {}
+    for name in names:
+        fn, requires = CASES[name]
+        missing = [
+            requirement for requirement in requires if not available[requirement]
+        ]
+        if missing:
+            print(f"{name:<40} skipped (no {', '.join(missing)})")
+            results[name] = None
+            continue
+        results[name] = statistics.median(fn() for _ in range(repeat))
+        print(f"{name:<40} {results[name] * 1e6:>10.2f} us")
+    return results
+
+
+def compare(
+    results: dict[str, Optional[float]], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Returns the cases that are more than `threshold` slower than the baseline."""
+    regressions = []
+    for name, seconds in results.items():
+        if seconds is None or name not in baseline:
+            continue
+        change = seconds / baseline[name] - 1
+        if change > threshold:
+            regressions.append(f"{name}: {change:+.0%}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k", dest="filter", default="", help="only run cases containing this"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--save", metavar="FILE", help="write the results as a baseline"
+    )
+    parser.add_argument(
+        "--baseline", metavar="FILE", help="compare against this baseline"
+    )
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if args.filter in name]
+    results = run(names, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({k: v for k, v in results.items() if v is not None}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Throughput of Tab 1 progress updates, from `Tab1Model` through the controller.
+
+The task's simulated delays are removed and the controller drives a headless view,
+so this measures the pubsub, controller and update scheduling cost per update. Run by
+`benchmarks.suite`; prints its result as JSON.
+"""
+import json
+import os
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "model_view_controller_emc"))
+
+import models  # noqa: E402  The tabbed app's models module
+from tab1_controller import Tab_1_Controller  # noqa: E402
+from tab1_headless import HeadlessRoot, Tab_1_HeadlessView  # noqa: E402
+
+
+def main() -> None:
+    models.time = types.SimpleNamespace(sleep=lambda seconds: None)  # type: ignore
+    root = HeadlessRoot()
+    controller = Tab_1_Controller(root, view_class=Tab_1_HeadlessView)
+
+    start = time.perf_counter()
+    controller.model.read_instrument_task()  # 1001 updates and a completion
+    root.drain()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"seconds_per_update": elapsed / 1002}))
+
+
+if __name__ == "__main__":
+    main()
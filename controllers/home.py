@@ -1,13 +1,20 @@
 from models.init_model import Model
 from views.init_view import View
+from views.home import HomeView
 
 
 class HomeController:
     def __init__(self, model: Model, view: View) -> None:
         self.model = model
         self.view = view
-        self.frame = self.view.frames["home"]
+        self.frame: HomeView
+        self.view.add_frame_listener("home", self._attach)
+
+    def _attach(self, frame: HomeView) -> None:
+        """Keeps a reference to the (re)built frame and binds its widgets"""
+        self.frame = frame
         self._bind()
+        self.update_view()
 
     def _bind(self) -> None:
         """Binds controller functions with respective buttons in the view"""
@@ -20,6 +27,6 @@ class HomeController:
         current_user = self.model.auth.current_user
         if current_user:
             username = current_user["username"]
-            self.frame.greeting.config(text=f"Welcome, {username}!")
+            self.view.updates.set(self.frame.greeting, text=f"Welcome, {username}!")
         else:
-            self.frame.greeting.config(text=f"")
+            self.view.updates.set(self.frame.greeting, text="")
@@ -1,26 +1,66 @@
+from typing import TYPE_CHECKING, Any
+
 from models.init_model import Model
+from models import passwords
 from models.auth import Auth
-from views.init_view import View
+from views.init_view import Factory, View, import_factory
 
-from .home import HomeController
-from .signin import SignInController
-from .signup import SignUpController
+if TYPE_CHECKING:
+    from .home import HomeController
+    from .signin import SignInController
+    from .signup import SignUpController
 
 
 class Controller:
     def __init__(self, model: Model, view: View) -> None:
         self.view = view
         self.model = model
-        self.signin_controller = SignInController(model, view)
-        self.signup_controller = SignUpController(model, view)
-        self.home_controller = HomeController(model, view)
+        self._controller_factories: dict[str, Factory] = {}
+        self._controllers: dict[str, Any] = {}
+
+        self.register_controller("signin", "controllers.signin:SignInController")
+        self.register_controller("signup", "controllers.signup:SignUpController")
+        self.register_controller("home", "controllers.home:HomeController")
 
         self.model.auth.add_event_listener("auth_changed", self.auth_state_listener)
+        # Passwords and usernames are checked in the background; handle the outcome
+        # on the Tk thread
+        self.model.auth.dispatch = lambda fn: self.view.root.after(0, fn)
+        self.model.availability.dispatch = lambda fn: self.view.root.after(0, fn)
+
+    def register_controller(self, name: str, factory: Factory) -> None:
+        """Registers the controller of the frame `name` without creating it.
+
+        The controller is created, and binds its frame, when the frame is built for
+        the first time, so startup cost only grows with the frames that are shown.
+        Like frame factories, `factory` can be a "module:Class" path imported then.
+        """
+        self._controller_factories[name] = factory
+        self.view.add_frame_listener(name, lambda frame: self.get_controller(name))
+
+    def get_controller(self, name: str) -> Any:
+        """Returns the controller of the frame `name`, creating it on first use."""
+        if name not in self._controllers:
+            factory = import_factory(self._controller_factories[name])
+            self._controllers[name] = factory(self.model, self.view)
+        return self._controllers[name]
+
+    @property
+    def signin_controller(self) -> "SignInController":
+        return self.get_controller("signin")
+
+    @property
+    def signup_controller(self) -> "SignUpController":
+        return self.get_controller("signup")
+
+    @property
+    def home_controller(self) -> "HomeController":
+        return self.get_controller("home")
 
     def auth_state_listener(self, data: Auth) -> None:
         if data.is_logged_in:
-            self.home_controller.update_view()
             self.view.switch("home")
+            self.home_controller.update_view()
         else:
             self.view.switch("signin")
 
@@ -29,7 +69,11 @@ class Controller:
         # self.model.auth.load_auth_state()
         if self.model.auth.is_logged_in:
             self.view.switch("home")
+            self.view.prewarm("signin")
         else:
             self.view.switch("signin")
+            self.view.prewarm("home", "signup")
+            # Start a hashing worker before the first sign in needs it
+            self.view.root.after_idle(passwords.start)
 
         self.view.start_mainloop()
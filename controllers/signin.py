@@ -1,13 +1,23 @@
+from tkinter import DISABLED, END, NORMAL
+
 from models.init_model import Model
-from models.auth import User
+from models.auth import Auth
 from views.init_view import View
+from views.signin import SignInView
 
 
 class SignInController:
     def __init__(self, model: Model, view: View) -> None:
         self.model = model
         self.view = view
-        self.frame = self.view.frames["signin"]
+        self.frame: SignInView
+        self.view.add_frame_listener("signin", self._attach)
+        self.model.auth.add_event_listener("auth_failed", self.show_error)
+        self.model.auth.add_event_listener("auth_pending", self.show_pending)
+
+    def _attach(self, frame: SignInView) -> None:
+        """Keeps a reference to the (re)built frame and binds its widgets"""
+        self.frame = frame
         self._bind()
 
     def _bind(self) -> None:
@@ -20,9 +30,22 @@ class SignInController:
 
     def signin(self) -> None:
         username = self.frame.username_input.get()
-        pasword = self.frame.password_input.get()
-        data = {"username": username, "password": pasword}
-        print(data)
-        self.frame.password_input.delete(0, last=len(pasword))
-        user: User = {"username": data["username"]}
-        self.model.auth.login(user)
+        password = self.frame.password_input.get()
+        self.frame.password_input.delete(0, END)
+        self.view.updates.set(self.frame.message, text="")
+        self.model.auth.login(username, password)
+
+    def show_error(self, auth: Auth) -> None:
+        if self.view.current == "signin":
+            self.view.updates.set(self.frame.message, text=auth.error)
+
+    def show_pending(self, auth: Auth) -> None:
+        """Disables signing in again while the password is being checked"""
+        # The form may have been left meanwhile, re-enable it anyway unless it was
+        # hibernated, in which case it is rebuilt enabled
+        if auth.is_pending and self.view.current == "signin":
+            self.view.updates.set(self.frame.signin_btn, state=DISABLED)
+            self.view.updates.set(self.frame.message, text="Signing in...")
+        elif not auth.is_pending and "signin" in self.view.frames:
+            self.view.updates.set(self.frame.signin_btn, state=NORMAL)
+            self.view.updates.set(self.frame.message, text="")
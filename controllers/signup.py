@@ -1,35 +1,117 @@
+from typing import Optional
+from tkinter import DISABLED, NORMAL, Event
+
 from models.init_model import Model
-from models.auth import User
+from models.auth import Auth
+from models.availability import UsernameAvailability
 from views.init_view import View
+from views.signup import SignUpView
 
 
 class SignUpController:
+    # Typing pause after which the username is checked, in milliseconds
+    check_delay_ms = 150
+
     def __init__(self, model: Model, view: View):
         self.model = model
         self.view = view
-        self.frame = self.view.frames["signup"]
+        self.frame: SignUpView
+        self._check_job: Optional[str] = None
+        self.view.add_frame_listener("signup", self._attach)
+        self.model.availability.add_event_listener(
+            "availability_changed", self.show_availability
+        )
+        self.model.availability.add_event_listener(
+            "availability_failed", self.show_availability
+        )
+        self.model.auth.add_event_listener("auth_failed", self.show_error)
+        self.model.auth.add_event_listener("auth_pending", self.show_pending)
+        self.model.auth.add_event_listener("auth_changed", self.on_auth_changed)
+
+    def _attach(self, frame: SignUpView) -> None:
+        """Keeps a reference to the (re)built frame and binds its widgets"""
+        self.frame = frame
         self._bind()
 
     def _bind(self) -> None:
         """Binds controller functions with respective buttons in the view"""
         self.frame.signup_btn.config(command=self.signup)
         self.frame.signin_btn.config(command=self.signin)
+        self.frame.username_input.bind("<KeyRelease>", self.on_username_changed)
 
     def signin(self) -> None:
         self.view.switch("signin")
 
     def signup(self) -> None:
-        data = {
-            "fullname": self.frame.fullname_input.get(),
-            "username": self.frame.username_input.get(),
-            "password": self.frame.password_input.get(),
-            "has_agreed": self.frame.has_agreed.get(),
-        }
-        print(data)
-        user: User = {"username": data["username"]}
-        self.model.auth.login(user)
-        self.clear_form()
-    
+        if not self.frame.has_agreed.get():
+            message = "Please agree to the Terms & Conditions"
+            self.view.updates.set(self.frame.message, text=message)
+            return
+        self.view.updates.set(self.frame.message, text="")
+        self.model.auth.signup(
+            username=self.frame.username_input.get(),
+            password=self.frame.password_input.get(),
+            fullname=self.frame.fullname_input.get(),
+        )
+
+    def on_username_changed(self, event: Optional[Event] = None) -> None:
+        """Checks the username once the user stops typing"""
+        if self._check_job is not None:
+            self.view.root.after_cancel(self._check_job)
+        self._check_job = self.view.root.after(self.check_delay_ms, self.check_username)
+
+    def check_username(self) -> None:
+        self._check_job = None
+        if "signup" not in self.view.frames:
+            return  # Hibernated since the user typed
+        username = self.frame.username_input.get()
+        if username:
+            self.model.availability.check(username)
+        else:
+            self.view.updates.set(self.frame.username_status, text="")
+
+    def show_availability(self, availability: UsernameAvailability) -> None:
+        if "signup" not in self.view.frames:
+            return
+        if availability.username != self.frame.username_input.get():
+            return  # Edited since; the next check will tell
+        if availability.error:
+            message = "Could not check the username"
+            self.view.updates.set(self.frame.username_status, text=message, fg="gray")
+        elif availability.available:
+            self.view.updates.set(
+                self.frame.username_status, text="Available", fg="green"
+            )
+        else:
+            self.view.updates.set(
+                self.frame.username_status, text="Already taken", fg="red"
+            )
+
+    def show_error(self, auth: Auth) -> None:
+        if self.view.current == "signup":
+            self.view.updates.set(self.frame.message, text=auth.error)
+
+    def show_pending(self, auth: Auth) -> None:
+        """Disables signing up again while the password is being hashed"""
+        # The form may have been left meanwhile, re-enable it anyway unless it was
+        # hibernated, in which case it is rebuilt enabled
+        if auth.is_pending and self.view.current == "signup":
+            self.view.updates.set(self.frame.signup_btn, state=DISABLED)
+            self.view.updates.set(self.frame.message, text="Creating account...")
+        elif not auth.is_pending and "signup" in self.view.frames:
+            self.view.updates.set(self.frame.signup_btn, state=NORMAL)
+            self.view.updates.set(self.frame.message, text="")
+
+    def on_auth_changed(self, auth: Auth) -> None:
+        """Clears the entered credentials once they are used"""
+        if not auth.is_logged_in:
+            return
+        # Switching to the home frame may already have hibernated this one
+        if "signup" in self.view.frames:
+            self.clear_form()
+        else:
+            self.view.discard_snapshot("signup")
+
     def clear_form(self) -> None:
         fullname = self.frame.fullname_input.get()
         username = self.frame.username_input.get()
@@ -40,3 +122,4 @@ class SignUpController:
         self.frame.password_input.delete(0, last=len(password))
 
         self.frame.has_agreed.set(False)
+        self.view.updates.set(self.frame.username_status, text="")
@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+
+class CallStats:
+    """Call count, cumulative time and recent durations of one event or listener."""
+
+    def __init__(self, samples: int = 2048):
+        self.count = 0
+        self.total = 0.0
+        self.max_fanout = 0
+        self.fanout_total = 0
+        self.durations: deque[float] = deque(maxlen=samples)
+
+    def add(self, duration: float, fanout: Optional[int] = None) -> None:
+        self.count += 1
+        self.total += duration
+        self.durations.append(duration)
+        if fanout is not None:
+            self.fanout_total += fanout
+            self.max_fanout = max(self.max_fanout, fanout)
+
+    @property
+    def p99(self) -> float:
+        ordered = sorted(self.durations)
+        return ordered[int(len(ordered) * 0.99)] if len(ordered) > 1 else self.total
+
+    def to_dict(self, with_fanout: bool = False) -> dict[str, Any]:
+        data = {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p99_ms": self.p99 * 1000,
+        }
+        if with_fanout:
+            data["mean_fanout"] = self.fanout_total / self.count if self.count else 0.0
+            data["max_fanout"] = self.max_fanout
+        return data
+
+
+class EventProfiler:
+    """Collects dispatch statistics for model events and pubsub topics.
+
+    Events are keyed by their source and name, e.g. `Auth:auth_changed` or
+    `pubsub:rotate_table_update`, listeners by event key and the listener's name.
+    Listeners whose p99 exceeds `budget` seconds are flagged in the report.
+    """
+
+    def __init__(self, budget: float = 0.016):
+        self.budget = budget
+        self.events: dict[str, CallStats] = {}
+        self.listeners: dict[tuple[str, str], CallStats] = {}
+        self._lock = threading.Lock()
+
+    def event_dispatched(self, event: str, fanout: int, duration: float) -> None:
+        with self._lock:
+            self.events.setdefault(event, CallStats()).add(duration, fanout)
+
+    def listener_called(self, event: str, listener: str, duration: float) -> None:
+        with self._lock:
+            self.listeners.setdefault((event, listener), CallStats()).add(duration)
+
+    def over_budget(self) -> list[dict[str, Any]]:
+        """Returns the listeners whose p99 duration is above the budget, slowest first."""
+        with self._lock:
+            slow = [
+                {"event": event, "listener": listener, "p99_ms": stats.p99 * 1000}
+                for (event, listener), stats in self.listeners.items()
+                if stats.p99 > self.budget
+            ]
+        return sorted(slow, key=lambda item: item["p99_ms"], reverse=True)
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            events = {
+                key: stats.to_dict(with_fanout=True)
+                for key, stats in self.events.items()
+            }
+            listeners = {
+                f"{event} -> {listener}": stats.to_dict()
+                for (event, listener), stats in self.listeners.items()
+            }
+        return {
+            "budget_ms": self.budget * 1000,
+            "events": events,
+            "listeners": listeners,
+            "over_budget": self.over_budget(),
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def listener_name(fn: Callable) -> str:
+    return getattr(fn, "__qualname__", None) or repr(fn)
+
+
+class PubSubProfiler:
+    """pypubsub notification handler feeding an `EventProfiler`.
+
+    pypubsub notifies a "pre" stage before the first listener of a message, an "in"
+    stage before every listener and a "post" stage after the last one, so each
+    listener's duration is the time until the next stage. Messages can be sent from
+    worker threads and from inside listeners, so the open messages are tracked per
+    thread as a stack.
+    """
+
+    def __init__(self, profiler: EventProfiler):
+        self.profiler = profiler
+        self._local = threading.local()
+
+    def install(self) -> "PubSubProfiler":
+        from pubsub import pub
+
+        pub.addNotificationHandler(self)
+        pub.setNotificationFlags(sendMessage=True)
+        return self
+
+    def _stack(self) -> list[list[Any]]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def notifySend(self, stage: str, topicObj, pubListener=None) -> None:
+        now = time.perf_counter()
+        stack = self._stack()
+        if stage == "pre":
+            # [event key, message start, fan-out, current listener, listener start]
+            stack.append([f"pubsub:{topicObj.getName()}", now, 0, None, now])
+            return
+        if not stack:
+            return
+
+        message = stack[-1]
+        if message[3] is not None:
+            self.profiler.listener_called(message[0], message[3], now - message[4])
+            message[3] = None
+        if stage == "in":
+            callable_ = pubListener.getCallable() if pubListener else None
+            message[2] += 1
+            message[3] = listener_name(callable_) if callable_ else str(pubListener)
+            message[4] = now
+        elif stage == "post":
+            stack.pop()
+            self.profiler.event_dispatched(message[0], message[2], now - message[1])
+
+    # The remaining notifications of pypubsub's INotificationHandler are not needed
+
+    def notifySubscribe(self, pubListener, topicObj, newSub) -> None:
+        pass
+
+    def notifyUnsubscribe(self, pubListener, topicObj) -> None:
+        pass
+
+    def notifyDeadListener(self, pubListener, topicObj) -> None:
+        pass
+
+    def notifyNewTopic(self, topicObj, description, required, argsDocs) -> None:
+        pass
+
+    def notifyDelTopic(self, topicName) -> None:
+        pass
@@ -0,0 +1,304 @@
+"""Records user interactions with the app and replays them to measure UI latency.
+
+Record a session, then replay it under a virtual display and compare reports:
+
+    python main.py --record session.jsonl
+    python -m diagnostics.replay run session.jsonl before.json
+    python -m diagnostics.replay run session.jsonl after.json
+    python -m diagnostics.replay compare before.json after.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tkinter
+from typing import Any, Optional, TypedDict
+
+# Input events recorded, with the event fields kept for each
+EVENTS = {
+    "KeyPress": ("keysym",),
+    "ButtonPress-1": ("x", "y"),
+    "ButtonRelease-1": ("x", "y"),
+    "FocusIn": (),
+}
+
+
+class Step(TypedDict, total=False):
+    t: int  # Milliseconds since the start of the recording
+    e: str  # Event sequence without brackets, or "command"
+    w: str  # Tk path of the widget
+    keysym: str
+    x: int
+    y: int
+    c: str  # Name of the command called
+
+
+class InteractionRecorder:
+    """Writes the input events of a Tk app to a JSON lines trace.
+
+    Key presses, left clicks and focus changes are recorded on every widget with
+    `bind_all`, along with the widget's Tk path. Widget commands run by Tk, such as
+    the controller methods bound to buttons, are recorded as `command` steps naming the
+    function, so the trace and the replay report show which controller action each
+    click caused.
+    """
+
+    def __init__(self, root: tkinter.Misc, path: str):
+        self.root = root
+        self.file = open(path, "w")
+        self.started = time.monotonic()
+        self._original_call_wrapper: Optional[Any] = None
+
+    def start(self) -> "InteractionRecorder":
+        for sequence in EVENTS:
+            self.root.bind_all(f"<{sequence}>", self._on_event(sequence), add="+")
+
+        recorder = self
+        original = self._original_call_wrapper = tkinter.CallWrapper.__call__
+
+        def __call__(wrapper, *args):
+            # Commands get no arguments; event bindings get the event fields and
+            # `after` callbacks are local functions of `Misc.after`
+            name = getattr(wrapper.func, "__qualname__", "")
+            if not args and "after.<locals>" not in name:
+                recorder.write({"e": "command", "c": name})
+            return original(wrapper, *args)
+
+        tkinter.CallWrapper.__call__ = __call__
+        return self
+
+    def stop(self) -> None:
+        if self._original_call_wrapper is not None:
+            tkinter.CallWrapper.__call__ = self._original_call_wrapper
+            self._original_call_wrapper = None
+        self.file.close()
+
+    def _on_event(self, sequence: str):
+        def record(event: tkinter.Event) -> None:
+            if sequence == "FocusIn" and not self._has_focus(event.widget):
+                return  # Focus moving through the widget's ancestors
+            step: Step = {"e": sequence, "w": str(event.widget)}
+            for field in EVENTS[sequence]:
+                step[field] = getattr(event, field)  # type: ignore
+            self.write(step)
+
+        return record
+
+    def _has_focus(self, widget: tkinter.Misc) -> bool:
+        try:
+            return self.root.focus_get() is widget
+        except KeyError:  # Focus in a widget tkinter did not create, e.g. a menu
+            return False
+
+    def write(self, step: Step) -> None:
+        step["t"] = int((time.monotonic() - self.started) * 1000)
+        self.file.write(json.dumps(step, separators=(",", ":")) + "\n")
+
+
+def load_trace(path: str) -> list[Step]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class Replayer:
+    """Replays a recorded trace with `event_generate` and times every step.
+
+    Each input event is sent to its widget at its recorded time, divided by `speed`, so
+    background work started by earlier steps progresses as it did when recorded. The
+    latency of a step is the time Tk takes to handle the event synchronously, handlers
+    included, plus the idle tasks it leaves behind such as redraws.
+
+    Tk only treats a button release as a click if the pointer entered the button
+    first, so the pointer is moved with `<Leave>` and `<Enter>` events before a
+    press on another widget. Focus changes are replayed with `focus_force`, so key
+    presses go to the widget that had the focus when they were recorded.
+
+    The root window is quit once the trace is done and `settle_ms` have passed.
+    """
+
+    def __init__(
+        self,
+        root: tkinter.Misc,
+        trace: list[Step],
+        speed: float = 1.0,
+        settle_ms: int = 500,
+    ):
+        self.root = root
+        self.trace = trace
+        self.speed = speed
+        self.settle_ms = settle_ms
+        self.steps: list[dict[str, Any]] = []
+        self._index = 0
+        self._started = 0.0
+        self._pointer: Optional[tkinter.Misc] = None  # Widget the pointer is in
+
+    def start(self) -> "Replayer":
+        self._started = time.monotonic()
+        self._schedule()
+        return self
+
+    def _schedule(self) -> None:
+        while (
+            self._index < len(self.trace) and self.trace[self._index]["e"] == "command"
+        ):
+            self._attribute(self.trace[self._index])
+            self._index += 1
+        if self._index == len(self.trace):
+            self.root.after(self.settle_ms, self.root.quit)
+            return
+
+        due = self.trace[self._index]["t"] / 1000 / self.speed
+        delay = max(due - (time.monotonic() - self._started), 0)
+        self.root.after(int(delay * 1000), self._play)
+
+    def _attribute(self, command: Step) -> None:
+        """Names the last played step after the command it caused."""
+        if self.steps and "command" not in self.steps[-1]:
+            self.steps[-1]["command"] = command["c"]
+
+    def _play(self) -> None:
+        step = self.trace[self._index]
+        self._index += 1
+        options = {field: step[field] for field in EVENTS[step["e"]]}  # type: ignore
+        try:
+            widget = self.root.nametowidget(step["w"])
+        except KeyError:
+            self.steps.append(
+                {"event": step["e"], "widget": step["w"], "missing": True}
+            )
+        else:
+            if step["e"] == "ButtonPress-1" and widget is not self._pointer:
+                self._move_pointer(widget, step["x"], step["y"])
+            started = time.perf_counter()
+            if step["e"] == "FocusIn":
+                widget.focus_force()
+            else:
+                widget.event_generate(f"<{step['e']}>", **options)
+            self.root.update_idletasks()
+            latency = time.perf_counter() - started
+            self.steps.append(
+                {"event": step["e"], "widget": step["w"], "latency_ms": latency * 1000}
+            )
+        self._schedule()
+
+    def _move_pointer(self, widget: tkinter.Misc, x: int, y: int) -> None:
+        """Sends the crossing events Tk's bindings expect before a click."""
+        if self._pointer is not None and self._pointer.winfo_exists():
+            self._pointer.event_generate("<Leave>")
+        widget.event_generate("<Enter>", x=x, y=y)
+        self._pointer = widget
+
+    def report(self) -> dict[str, Any]:
+        """Per step latencies and a summary per step label.
+
+        Labels combine the event, widget and command, which are the same in every run
+        of a trace, so the summaries of two runs can be compared with `compare`.
+        """
+        groups: dict[str, list[float]] = {}
+        for step in self.steps:
+            if "latency_ms" in step:
+                label = f"{step['event']} {step['widget']} {step.get('command', '')}".rstrip()
+                groups.setdefault(label, []).append(step["latency_ms"])
+        summary = {
+            label: {
+                "count": len(values),
+                "median_ms": statistics.median(values),
+                "max_ms": max(values),
+                "total_ms": sum(values),
+            }
+            for label, values in groups.items()
+        }
+        return {"steps": self.steps, "summary": summary}
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def compare(before: dict, after: dict, threshold: float = 0.2) -> list[str]:
+    """Returns the labels whose median latency grew by more than `threshold`."""
+    regressions = []
+    for label, stats in after["summary"].items():
+        old = before["summary"].get(label)
+        if old and stats["median_ms"] > old["median_ms"] * (1 + threshold):
+            regressions.append(label)
+    return regressions
+
+
+def start_xvfb(display: str = ":99") -> Optional[subprocess.Popen]:
+    """Starts a virtual X server unless a display is already available."""
+    if os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        raise RuntimeError("No DISPLAY set and Xvfb is not installed")
+    server = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24"])
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)  # Let the server accept connections
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m diagnostics.replay")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser(
+        "run", help="replay a trace under Xvfb and write a report"
+    )
+    run.add_argument("trace")
+    run.add_argument("report")
+    run.add_argument(
+        "--app", default="main.py", help="app entry point (default: main.py)"
+    )
+    run.add_argument("--speed", type=float, default=1.0)
+
+    diff = commands.add_parser("compare", help="compare two reports")
+    diff.add_argument("before")
+    diff.add_argument("after")
+    diff.add_argument("--threshold", type=float, default=0.2)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        server = start_xvfb()
+        try:
+            app = os.path.abspath(args.app)
+            return subprocess.call(
+                [
+                    sys.executable,
+                    os.path.basename(app),
+                    "--replay",
+                    os.path.abspath(args.trace),
+                    "--replay-report",
+                    os.path.abspath(args.report),
+                    "--replay-speed",
+                    str(args.speed),
+                ],
+                cwd=os.path.dirname(app),
+            )
+        finally:
+            if server:
+                server.terminate()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+    for label in sorted(after["summary"]):
+        new = after["summary"][label]["median_ms"]
+        old = before["summary"].get(label, {}).get("median_ms")
+        if old:
+            print(f"{label}: {old:.2f} -> {new:.2f} ms ({new / old - 1:+.0%})")
+        else:
+            print(f"{label}: {new:.2f} ms (new)")
+    regressions = compare(before, after, args.threshold)
+    for label in regressions:
+        print(f"REGRESSION {label}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypedDict
+from tkinter import Misc
+
+
+class Phase(TypedDict):
+    name: str
+    ms: float  # Duration of the phase
+    at_ms: float  # Time since the profiler was created, at the end of the phase
+
+
+class StartupProfiler:
+    """Breaks the time to the first usable window down into phases.
+
+    Phases are either timed explicitly with `phase`, or end at a `mark`, in which case
+    they last from the previous mark. `watch_first_paint` adds the last two marks: when
+    the root window is first mapped on screen, and when Tk is idle after that, which is
+    when the window responds to input. Marks made after that, like frames prewarmed
+    in the background, are ignored.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: list[Phase] = []
+        self.ready = False
+        self._last = self.started
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self.mark(f"before {name}", record=False)
+        yield
+        self.mark(name)
+
+    def mark(self, name: str, record: bool = True) -> None:
+        if self.ready:
+            return
+        now = time.perf_counter()
+        if record:
+            self.phases.append(
+                {
+                    "name": name,
+                    "ms": (now - self._last) * 1000,
+                    "at_ms": (now - self.started) * 1000,
+                }
+            )
+        self._last = now
+
+    def watch_first_paint(
+        self, root: Misc, on_ready: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Marks the first map of `root` and the first idle moment after it."""
+
+        def mapped(event) -> None:
+            if event.widget is not root:
+                return
+            root.unbind("<Map>", binding)
+            self.mark("first paint")
+            root.after_idle(ready)
+
+        def ready() -> None:
+            self.mark("first idle")
+            self.ready = True
+            if on_ready:
+                on_ready()
+
+        binding = root.bind("<Map>", mapped, add="+")
+
+    def report(self) -> dict:
+        return {
+            "total_ms": self.phases[-1]["at_ms"] if self.phases else 0.0,
+            "phases": self.phases,
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
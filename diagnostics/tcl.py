@@ -0,0 +1,162 @@
+import json
+import os
+import sys
+import threading
+import time
+import tkinter
+from collections import Counter, defaultdict
+from typing import Any, Optional
+
+_TKINTER_DIR = os.path.dirname(tkinter.__file__)
+
+
+def handler_name(func: Any) -> str:
+    """Returns the qualified name of a Tk callback.
+
+    `Misc.after` registers a local `callit` function that calls the scheduled one, so
+    every `after` job would be named `Misc.after.<locals>.callit`; the scheduled
+    function is taken from its closure instead.
+    """
+    code = getattr(func, "__code__", None)
+    if code is not None and code.co_name == "callit" and "func" in code.co_freevars:
+        func = func.__closure__[code.co_freevars.index("func")].cell_contents
+    return getattr(func, "__qualname__", None) or repr(func)
+
+
+class TclProxy:
+    """Stands in for a Tcl interpreter object and reports every command run on it.
+
+    Widgets keep a reference to the interpreter in their `tk` attribute and send all
+    their commands through its `call` and `eval` methods. Everything else is forwarded
+    untouched.
+    """
+
+    def __init__(self, tkapp: Any, profiler: "TclProfiler"):
+        self._tkapp = tkapp
+        self._profiler = profiler
+
+    def call(self, *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return self._tkapp.call(*args)
+        finally:
+            self._profiler.record(args, time.perf_counter() - started)
+
+    def eval(self, script: str) -> Any:
+        started = time.perf_counter()
+        try:
+            return self._tkapp.eval(script)
+        finally:
+            self._profiler.record(("eval",), time.perf_counter() - started)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._tkapp, name)
+
+
+class TclProfiler:
+    """Attributes every Python→Tcl call to the Tk callback that caused it.
+
+    `install` replaces the interpreter of the root window and its existing widgets with
+    a `TclProxy` and wraps `tkinter.CallWrapper`, through which Tk invokes every Python
+    callback (button commands, event bindings, `after` jobs). Each Tcl command is then
+    counted and timed under the callback running at that moment, or `<main>` outside
+    of any callback, together with the Python line that issued it.
+
+    Meant for debugging only: finding the call site costs a stack walk per Tcl call.
+    """
+
+    def __init__(self):
+        self.handlers: dict[str, list[float]] = defaultdict(lambda: [0, 0.0])
+        self.commands: dict[str, Counter] = defaultdict(Counter)
+        self.sites: dict[str, list[float]] = defaultdict(lambda: [0, 0.0])
+        self._local = threading.local()
+        self._original_call_wrapper: Optional[Any] = None
+
+    def install(self, root: tkinter.Misc) -> "TclProfiler":
+        proxy = TclProxy(root.tk, self)
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            widget.tk = proxy
+            stack.extend(widget.children.values())
+
+        profiler = self
+        original = self._original_call_wrapper = tkinter.CallWrapper.__call__
+
+        def __call__(wrapper, *args):
+            name = handler_name(wrapper.func)
+            stack = profiler._handler_stack()
+            stack.append(name)
+            try:
+                return original(wrapper, *args)
+            finally:
+                stack.pop()
+
+        tkinter.CallWrapper.__call__ = __call__
+        return self
+
+    def uninstall(self) -> None:
+        if self._original_call_wrapper is not None:
+            tkinter.CallWrapper.__call__ = self._original_call_wrapper
+            self._original_call_wrapper = None
+
+    def _handler_stack(self) -> list[str]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def record(self, args: tuple, duration: float) -> None:
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]  # Widget creation passes its command as a single tuple
+        command = str(args[0]) if args else "?"
+        if command.startswith(".") and len(args) > 1:
+            command = f"<widget> {args[1]}"
+
+        stack = self._handler_stack()
+        handler = stack[-1] if stack else "<main>"
+        totals = self.handlers[handler]
+        totals[0] += 1
+        totals[1] += duration
+        self.commands[handler][command] += 1
+
+        site = self._call_site()
+        site_totals = self.sites[f"{handler} @ {site}"]
+        site_totals[0] += 1
+        site_totals[1] += duration
+
+    @staticmethod
+    def _call_site() -> str:
+        """Returns the first Python line outside tkinter and this module on the stack."""
+        frame = sys._getframe(2)
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if not filename.startswith(_TKINTER_DIR) and filename != __file__:
+                return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+            frame = frame.f_back
+        return "?"
+
+    def report(self, top: int = 20) -> dict[str, Any]:
+        handlers = {
+            name: {
+                "calls": int(calls),
+                "tcl_ms": seconds * 1000,
+                "commands": dict(self.commands[name].most_common()),
+            }
+            for name, (calls, seconds) in sorted(
+                self.handlers.items(), key=lambda item: item[1][0], reverse=True
+            )
+        }
+        sites = sorted(self.sites.items(), key=lambda item: item[1][0], reverse=True)
+        return {
+            "handlers": handlers,
+            "top_call_sites": [
+                {"site": site, "calls": int(calls), "tcl_ms": seconds * 1000}
+                for site, (calls, seconds) in sites[:top]
+            ],
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,106 @@
+import bisect
+import json
+import sys
+import threading
+import time
+import traceback
+from typing import Optional, TypedDict
+from tkinter import Misc
+
+
+class Stall(TypedDict):
+    started: float
+    duration: float
+    stack: list[str]
+
+
+class MainLoopWatchdog:
+    """Detects stalls of the Tk main loop and records what it was doing.
+
+    An `after` callback on the main loop acts as a heartbeat. A watchdog thread checks
+    that the heartbeat keeps coming; when it has been silent for longer than
+    `threshold` seconds, the Python stack of the main thread is captured with
+    `sys._current_frames`, which points at the listener or tree operation blocking
+    the loop. The delay of every heartbeat is also added to a latency histogram.
+    """
+
+    # Upper bounds in milliseconds of the latency histogram buckets
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(
+        self,
+        root: Misc,
+        threshold: float = 0.2,
+        interval: float = 0.05,
+        max_stalls: int = 100,
+    ):
+        self.root = root
+        self.threshold = threshold
+        self.interval = interval
+        self.max_stalls = max_stalls
+        self.histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        self.stalls: list[Stall] = []
+        self._main_thread_id = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._current_stall: Optional[Stall] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._watch, name="watchdog", daemon=True
+        )
+
+    def start(self) -> "MainLoopWatchdog":
+        self._last_beat = time.monotonic()
+        self.root.after(int(self.interval * 1000), self._beat)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _beat(self) -> None:
+        """Heartbeat on the main loop; its delay is the event loop latency."""
+        now = time.monotonic()
+        latency_ms = max(now - self._last_beat - self.interval, 0.0) * 1000
+        self.histogram[bisect.bisect_left(self.BUCKETS_MS, latency_ms)] += 1
+
+        stall = self._current_stall
+        if stall is not None:
+            stall["duration"] = now - stall["started"]
+            self._current_stall = None
+        self._last_beat = now
+
+        if not self._stop.is_set():
+            self.root.after(int(self.interval * 1000), self._beat)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            silent = time.monotonic() - self._last_beat
+            if silent < self.threshold or self._current_stall is not None:
+                continue
+            if len(self.stalls) >= self.max_stalls:
+                continue
+
+            frame = sys._current_frames().get(self._main_thread_id)  # type: ignore
+            stall: Stall = {
+                "started": self._last_beat,
+                "duration": silent,
+                "stack": traceback.format_stack(frame) if frame else [],
+            }
+            self.stalls.append(stall)
+            self._current_stall = stall
+
+    def report(self) -> dict:
+        """Returns the histogram and stalls in a JSON serialisable form."""
+        labels = [f"<={bound}ms" for bound in self.BUCKETS_MS] + [
+            f">{self.BUCKETS_MS[-1]}ms"
+        ]
+        return {
+            "threshold_s": self.threshold,
+            "heartbeat_s": self.interval,
+            "latency_histogram": dict(zip(labels, self.histogram)),
+            "stalls": self.stalls,
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
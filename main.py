@@ -1,13 +1,144 @@
-from models.init_model import Model
-from views.init_view import View
-from controllers.init_controller import Controller
+import argparse
+from contextlib import nullcontext
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--watchdog",
+        metavar="FILE",
+        help="record main loop stalls and latency, written to FILE on exit",
+    )
+    parser.add_argument(
+        "--profile-events",
+        metavar="FILE",
+        help="time model events and their listeners, written to FILE on exit",
+    )
+    parser.add_argument(
+        "--profile-tcl",
+        metavar="FILE",
+        help="count Tcl calls per Tk callback and call site, written to FILE on exit",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        metavar="FILE",
+        help="write the time taken by each startup phase to FILE once the window is usable",
+    )
+    parser.add_argument(
+        "--exit-when-ready",
+        action="store_true",
+        help="quit as soon as the window is usable, to time startup",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="record input events and commands to the trace FILE",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="replay the trace FILE, then exit",
+    )
+    parser.add_argument(
+        "--replay-report",
+        metavar="FILE",
+        help="write the replay step latencies to FILE",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="replay speed relative to the recording",
+    )
+    return parser.parse_args()
 
 
 def main():
-    model = Model()
-    view = View()
-    controller = Controller(model, view)
+    args = parse_args()
+
+    startup = None
+    if args.profile_startup or args.exit_when_ready:
+        from diagnostics.startup import StartupProfiler
+
+        startup = StartupProfiler()
+    phase = startup.phase if startup else lambda name: nullcontext()
+
+    # Frame and controller modules are only imported when their frame is first built
+    with phase("import models"):
+        from models import passwords
+        from models.init_model import Model
+    with phase("import views"):
+        from views.init_view import View
+    with phase("import controllers"):
+        from controllers.init_controller import Controller
+
+    event_profiler = None
+    if args.profile_events:
+        from diagnostics.events import EventProfiler
+        from models.base import ObservableModel
+
+        event_profiler = ObservableModel.profiler = EventProfiler()
+
+    with phase("create model"):
+        model = Model()
+    with phase("create root window"):
+        view = View()
+    if startup:
+        for name in ("signin", "signup", "home"):
+            view.add_frame_listener(
+                name, lambda frame, name=name: startup.mark(f"build {name}")
+            )
+        view.root.after(0, lambda: startup.mark("bind controllers, enter main loop"))
+
+        def on_ready() -> None:
+            if args.profile_startup:
+                startup.dump(args.profile_startup)
+            if args.exit_when_ready:
+                view.root.quit()
+
+        startup.watch_first_paint(view.root, on_ready)
+    with phase("create controller"):
+        controller = Controller(model, view)
+
+    tcl_profiler = None
+    if args.profile_tcl:
+        from diagnostics.tcl import TclProfiler
+
+        tcl_profiler = TclProfiler().install(view.root)
+
+    watchdog = None
+    if args.watchdog:
+        from diagnostics.watchdog import MainLoopWatchdog
+
+        watchdog = MainLoopWatchdog(view.root).start()
+
+    recorder = replayer = None
+    if args.record:
+        from diagnostics.replay import InteractionRecorder
+
+        recorder = InteractionRecorder(view.root, args.record).start()
+    if args.replay:
+        from diagnostics.replay import Replayer, load_trace
+
+        trace = load_trace(args.replay)
+        replayer = Replayer(view.root, trace, speed=args.replay_speed).start()
+
     controller.start()
+    passwords.shutdown()
+
+    if recorder:
+        recorder.stop()
+    if replayer and args.replay_report:
+        replayer.dump(args.replay_report)
+
+    if watchdog:
+        watchdog.stop()
+        watchdog.dump(args.watchdog)
+    if event_profiler:
+        event_profiler.dump(args.profile_events)
+    if tcl_profiler:
+        tcl_profiler.uninstall()
+        tcl_profiler.dump(args.profile_tcl)
 
 
 if __name__ == "__main__":
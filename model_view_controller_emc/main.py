@@ -1,31 +1,38 @@
 # main.py
+import argparse
+import importlib
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk
-from tab1_controller import Tab_1_Controller
-from tab2_view import Tab_2
-from tab3_view import Tab_3
-from tab4_view import Tab_4
+
+# Tab title -> (module, class). Modules are only imported when their tab is first selected,
+# so heavy analysis and plotting dependencies of a tab are not loaded at launch.
+TABS = {
+    "Tab 1": ("tab1_controller", "Tab_1_Controller"),
+    "Tab 2": ("tab2_view", "Tab_2"),
+    "Tab 3": ("tab3_view", "Tab_3"),
+    "Tab 4": ("tab4_view", "Tab_4"),
+}
 
 
 class MainApplication:
-    def __init__(self, root):
+    def __init__(self, root, tabs=TABS):
         self.root = root
         self.root.title("Tkinter Application with 4 Tabs")
         self.root.geometry("1100x800+100+100")
 
         self.notebook = ttk.Notebook(self.root)
+        self.tab_registry = dict(tabs)
+        self.tabs = {}  # Tab title -> controller/view, once built
 
-        # Instantiate each tab controller/view
-        self.tab1 = Tab_1_Controller(self.notebook)
-        self.tab2 = Tab_2(self.notebook)
-        self.tab3 = Tab_3(self.notebook)
-        self.tab4 = Tab_4(self.notebook)
-
-        # Add the tabs to the notebook (tab container)
-        self.notebook.add(self.tab1.view.frame, text="Tab 1")
-        self.notebook.add(self.tab2.frame, text="Tab 2")
-        self.notebook.add(self.tab3.frame, text="Tab 3")
-        self.notebook.add(self.tab4.frame, text="Tab 4")
+        # Add an empty container per tab; its content is built on first selection
+        self.containers = {}
+        for title in self.tab_registry:
+            container = ttk.Frame(self.notebook)
+            self.notebook.add(container, text=title)
+            self.containers[title] = container
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
         # Pack the notebook to make it visible
         self.notebook.pack(expand=True, fill='both')
@@ -34,8 +41,93 @@ class MainApplication:
         quit_button = ttk.Button(self.root, text="Quit", command=self.root.quit)
         quit_button.pack(side="bottom", pady=10)
 
+        # The first tab is selected without any tab change, build it right away
+        self.on_tab_changed()
+
+    def on_tab_changed(self, event=None):
+        """Build the selected tab the first time it is shown."""
+        title = self.notebook.tab(self.notebook.select(), "text")
+        if title not in self.tabs:
+            self.build_tab(title)
+
+    def build_tab(self, title):
+        """Import the tab's module and instantiate its controller/view inside the tab container."""
+        module_name, class_name = self.tab_registry[title]
+        tab_class = getattr(importlib.import_module(module_name), class_name)
+        tab = tab_class(self.containers[title])
+
+        # Controllers own their view, plain views own the frame directly
+        frame = tab.view.frame if hasattr(tab, "view") else tab.frame
+        frame.pack(expand=True, fill='both')
+        self.tabs[title] = tab
+        return tab
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile-events", metavar="FILE",
+                        help="time pubsub messages and their listeners, written to FILE on exit")
+    parser.add_argument("--profile-tcl", metavar="FILE",
+                        help="count Tcl calls per Tk callback and call site, written to FILE on exit")
+    parser.add_argument("--profile-startup", metavar="FILE",
+                        help="write the time taken by each startup phase to FILE once the window is usable")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record input events and commands to the trace FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay the trace FILE, then exit")
+    parser.add_argument("--replay-report", metavar="FILE",
+                        help="write the replay step latencies to FILE")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="replay speed relative to the recording")
+    args = parser.parse_args()
+
+    diagnostics = (args.profile_events, args.profile_tcl, args.profile_startup, args.record, args.replay)
+    if any(diagnostics):
+        # The diagnostics package lives at the repository root
+        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    profiler = None
+    if args.profile_events:
+        from diagnostics.events import EventProfiler, PubSubProfiler
+        profiler = EventProfiler()
+        PubSubProfiler(profiler).install()
+
+    startup = None
+    if args.profile_startup:
+        from diagnostics.startup import StartupProfiler
+        startup = StartupProfiler()
+
+    # Create the main window
+    root = tk.Tk()
+    if startup:
+        startup.mark("create root window")
+        startup.watch_first_paint(root, lambda: startup.dump(args.profile_startup))
+    tcl_profiler = None
+    if args.profile_tcl:
+        from diagnostics.tcl import TclProfiler
+        tcl_profiler = TclProfiler().install(root)
+    app = MainApplication(root)
+    if startup:
+        startup.mark("build notebook and first tab")
+    recorder = replayer = None
+    if args.record:
+        from diagnostics.replay import InteractionRecorder
+        recorder = InteractionRecorder(root, args.record).start()
+    if args.replay:
+        from diagnostics.replay import Replayer, load_trace
+        replayer = Replayer(root, load_trace(args.replay), speed=args.replay_speed).start()
+    root.mainloop()
+
+    if recorder:
+        recorder.stop()
+    if replayer and args.replay_report:
+        replayer.dump(args.replay_report)
+
+    if profiler:
+        profiler.dump(args.profile_events)
+    if tcl_profiler:
+        tcl_profiler.uninstall()
+        tcl_profiler.dump(args.profile_tcl)
+
 
-# Create the main window
-root = tk.Tk()
-app = MainApplication(root)
-root.mainloop()
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,25 @@
 # tab1_controller.py
+import os
+import sys
 from pubsub import pub
 from models import Tab1Model
 from tab1_view import Tab_1_View
 import threading
+import tkinter as tk
+
+# UpdateScheduler is shared with the app at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from views.updates import UpdateScheduler
 
 
 class Tab_1_Controller:
-    def __init__(self, parent):
+    def __init__(self, parent, view_class=Tab_1_View):
+        # view_class can be tab1_headless.Tab_1_HeadlessView to run without a display
         self.model = Tab1Model()
-        self.view = Tab_1_View(parent)
+        self.view = view_class(parent)
+
+        # Label updates arrive from the task threads far faster than the screen refreshes
+        self.updates = UpdateScheduler(self.view.frame)
 
         # Bind view buttons to controller methods
         self.view.table_button.config(command=self.start_rotate_table)
@@ -27,48 +38,66 @@ class Tab_1_Controller:
         pub.subscribe(self.on_read_instrument_completed, "read_instrument_completed")
 
     def start_rotate_table(self):
-        self.view.disable_buttons()
+        self.set_running(True)
         self.model.abort_flag.clear()  # Reset the abort flag
-        threading.Thread(target=self.model.rotate_table_task).start()
+        self._start_task(self.model.rotate_table_task)
 
     def start_move_tower(self):
-        self.view.disable_buttons()
+        self.set_running(True)
         self.model.abort_flag.clear()  # Reset the abort flag
-        threading.Thread(target=self.model.move_tower_task).start()
+        self._start_task(self.model.move_tower_task)
 
     def start_read_instrument(self):
-        self.view.disable_buttons()
+        self.set_running(True)
         self.model.abort_flag.clear()  # Reset the abort flag
-        threading.Thread(target=self.model.read_instrument_task).start()
+        self._start_task(self.model.read_instrument_task)
+
+    def _start_task(self, task):
+        thread = threading.Thread(target=task)
+        self.updates.watch(thread)  # Its progress updates are applied from the main loop
+        thread.start()
 
     def abort_process(self):
         self.model.abort_process()
-        self.view.enable_buttons()
+        self.set_running(False)
+
+    def set_running(self, running):
+        """Disable the task buttons while a task runs, and enable Abort.
+
+        Completions arrive on the task thread, so button states go through the update
+        scheduler like the labels. Clicks on the Tk thread apply them right away, so a
+        second click cannot start another task before the next flush.
+        """
+        for button in (self.view.table_button, self.view.tower_button, self.view.instrument_button):
+            self.updates.set(button, state=tk.DISABLED if running else tk.NORMAL)
+        self.updates.set(self.view.abort_button, state=tk.NORMAL if running else tk.DISABLED)
+        if threading.current_thread() is threading.main_thread():
+            self.updates.flush()
 
     def update_rotate_table(self, angle):
         if not self.model.abort_flag.is_set():
-            self.view.table_label.config(text=f"Table Rotation: {angle}°")
+            self.updates.set(self.view.table_label, text=f"Table Rotation: {angle}°")
 
     def update_move_tower(self, height):
         if not self.model.abort_flag.is_set():
-            self.view.tower_label.config(text=f"Tower Height: {height} cm")
+            self.updates.set(self.view.tower_label, text=f"Tower Height: {height} cm")
 
     def update_read_instrument(self, point):
         if not self.model.abort_flag.is_set():
-            self.view.instrument_label.config(text=f"Instrument Reading: {point} points")
+            self.updates.set(self.view.instrument_label, text=f"Instrument Reading: {point} points")
 
     def on_rotate_table_completed(self, status):
         if not self.model.abort_flag.is_set():
-            self.view.table_label.config(text=status)
-        self.view.enable_buttons()
+            self.updates.set(self.view.table_label, text=status)
+        self.set_running(False)
 
     def on_move_tower_completed(self, status):
         if not self.model.abort_flag.is_set():
-            self.view.tower_label.config(text=status)
-        self.view.enable_buttons()
+            self.updates.set(self.view.tower_label, text=status)
+        self.set_running(False)
 
     def on_read_instrument_completed(self, status):
         if not self.model.abort_flag.is_set():
-            self.view.instrument_label.config(text=status)
-        self.view.enable_buttons()
+            self.updates.set(self.view.instrument_label, text=status)
+        self.set_running(False)
 
@@ -0,0 +1,69 @@
+# tab1_headless.py
+import os
+import sys
+import tkinter as tk
+
+# HeadlessRoot is shared with the app at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from views.headless import HeadlessRoot  # Re-exported for drivers of Tab 1
+
+
+class HeadlessWidget:
+    """Label, button or frame keeping its options in a dict."""
+
+    def __init__(self, master, **options):
+        self.master = master
+        self.options = dict(options)
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key):
+        return self.options.get(key, "")
+
+    def after(self, ms, func, *args):
+        return self.master.after(ms, func, *args)
+
+    def invoke(self):
+        """Calls the button's command, as a click would."""
+        command = self.options.get("command")
+        if command and self.options.get("state") != tk.DISABLED:
+            return command()
+
+    def grid(self, **options):
+        pass
+
+    pack = grid
+
+
+class Tab_1_HeadlessView:
+    """Tab_1_View without Tk, to drive Tab_1_Controller with no display.
+
+    Pass it as the controller's `view_class`, with a `HeadlessRoot` as the parent.
+    """
+
+    def __init__(self, parent):
+        self.frame = HeadlessWidget(parent)
+
+        self.table_label = HeadlessWidget(self.frame, text="Table Rotation: Waiting...")
+        self.tower_label = HeadlessWidget(self.frame, text="Tower Height: Waiting...")
+        self.instrument_label = HeadlessWidget(self.frame, text="Instrument Reading: Waiting...")
+
+        self.table_button = HeadlessWidget(self.frame, text="Start Table Rotation")
+        self.tower_button = HeadlessWidget(self.frame, text="Start Tower Movement")
+        self.instrument_button = HeadlessWidget(self.frame, text="Start Instrument Reading")
+        self.abort_button = HeadlessWidget(self.frame, text="Abort", state=tk.DISABLED)
+
+    def disable_buttons(self):
+        self.table_button.config(state=tk.DISABLED)
+        self.tower_button.config(state=tk.DISABLED)
+        self.instrument_button.config(state=tk.DISABLED)
+        self.abort_button.config(state=tk.NORMAL)
+
+    def enable_buttons(self):
+        self.table_button.config(state=tk.NORMAL)
+        self.tower_button.config(state=tk.NORMAL)
+        self.instrument_button.config(state=tk.NORMAL)
+        self.abort_button.config(state=tk.DISABLED)
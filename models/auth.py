@@ -1,5 +1,9 @@
-from typing import TypedDict, Union
+import sqlite3
+from concurrent.futures import Future
+from typing import Callable, Optional, TypedDict, Union
 from .base import ObservableModel
+from .passwords import hash_password_async, verify_password_async
+from .user_store import UserRecord, UserStore
 
 
 class User(TypedDict):
@@ -7,17 +11,105 @@ class User(TypedDict):
 
 
 class Auth(ObservableModel):
-    def __init__(self):
+    """Signed in state, checked against the accounts of a `UserStore`.
+
+    Password hashing takes a large fraction of a second by design, so it runs in the
+    process pool of `models.passwords` and `login` and `signup` return right away.
+    Their outcome is reported through events, which are triggered through `dispatch`.
+
+    Events:
+        auth_pending: A password is being checked or hashed, or that just finished;
+            see `is_pending`.
+        auth_changed: A user signed in or out.
+        auth_failed: Signing in or up was refused; `error` tells why.
+    """
+
+    def __init__(self, store: UserStore):
         super().__init__()
+        self.store = store
         self.is_logged_in = False
+        self.is_pending = False
         self.current_user: Union[User, None] = None
+        self.error: Optional[str] = None
+        # Runs a function on the thread listeners expect to be called from. The
+        # default calls it right away, in the pool's result thread, which is safe for
+        # the store; a GUI sets it to schedule the function on its main loop.
+        self.dispatch: Callable[[Callable[[], None]], None] = lambda fn: fn()
 
-    def login(self, user: User) -> None:
-        self.is_logged_in = True
-        self.current_user = user
-        self.trigger_event("auth_changed")
+    def login(self, username: str, password: str) -> None:
+        if self.is_pending:
+            return
+        record = self.store.get(username)
+        if record is None:
+            self._fail("Invalid username or password")
+            return
+
+        self._set_pending(True)
+        future = verify_password_async(password, record["password_hash"])
+        future.add_done_callback(
+            lambda future: self.dispatch(lambda: self._verified(username, future))
+        )
+
+    def _verified(self, username: str, future: "Future[bool]") -> None:
+        self._set_pending(False)
+        if future.cancelled() or future.exception() or not future.result():
+            self._fail("Invalid username or password")
+            return
+        self._set_user({"username": username})
+
+    def signup(self, username: str, password: str, fullname: str = "") -> None:
+        if self.is_pending:
+            return
+        if not username or not password:
+            self._fail("Username and password are required")
+            return
+        if self.store.get(username) is not None:  # Checked again when it is stored
+            self._fail(f"The username {username} is already taken")
+            return
+
+        self._set_pending(True)
+        future = hash_password_async(password)
+        future.add_done_callback(
+            lambda future: self.dispatch(
+                lambda: self._hashed(username, fullname, future)
+            )
+        )
+
+    def _hashed(self, username: str, fullname: str, future: "Future[str]") -> None:
+        self._set_pending(False)
+        if future.cancelled() or future.exception():
+            self._fail("The account could not be created")
+            return
+        record: UserRecord = {
+            "username": username,
+            "fullname": fullname,
+            "password_hash": future.result(),
+        }
+        try:
+            added = self.store.add(record)
+        except sqlite3.Error:
+            self._fail("The account could not be created")
+            return
+        if not added:
+            self._fail(f"The username {username} is already taken")
+            return
+        self._set_user({"username": username})
 
     def logout(self) -> None:
         self.is_logged_in = False
         self.current_user = None
         self.trigger_event("auth_changed")
+
+    def _set_pending(self, pending: bool) -> None:
+        self.is_pending = pending
+        self.trigger_event("auth_pending")
+
+    def _set_user(self, user: User) -> None:
+        self.error = None
+        self.is_logged_in = True
+        self.current_user = user
+        self.trigger_event("auth_changed")
+
+    def _fail(self, error: str) -> None:
+        self.error = error
+        self.trigger_event("auth_failed")
@@ -0,0 +1,92 @@
+import sqlite3
+import threading
+from functools import partial
+from typing import Callable, Optional
+
+from .base import ObservableModel
+from .user_store import SELECT_USERNAME, UserStore
+
+
+class UsernameAvailability(ObservableModel):
+    """Tells whether usernames are still free, looked up on a background thread.
+
+    The lookups use their own connection to the user store, so they never wait for
+    the GUI thread and, with write-ahead logging, not for writers either. Only the
+    latest username asked for is looked up: a check requested while another one is
+    waiting replaces it, and answers for usernames that were replaced meanwhile are
+    dropped instead of reported.
+
+    Events:
+        availability_changed: `username` was looked up; see `available`.
+        availability_failed: `username` could not be looked up; `error` tells why.
+    """
+
+    def __init__(self, store: UserStore):
+        super().__init__()
+        self.store = store
+        self.username: Optional[str] = None
+        self.available: Optional[bool] = None
+        self.error: Optional[str] = None
+        # Runs a function on the thread listeners expect to be called from, see Auth
+        self.dispatch: Callable[[Callable[[], None]], None] = lambda fn: fn()
+        self._requested: Optional[str] = None
+        self._pending: Optional[str] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self, username: str) -> None:
+        """Looks the username up in the background."""
+        with self._condition:
+            self._requested = self._pending = username
+            self._condition.notify()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="username-availability", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        with self._condition:
+            username = self._pending
+        try:
+            connection = self.store.connect()
+        except sqlite3.Error as error:
+            with self._condition:
+                self._thread = None  # The next check starts a new thread
+            self._report_error(username, error)
+            return
+
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                username, self._pending = self._pending, None
+            try:
+                row = connection.execute(SELECT_USERNAME, (username,)).fetchone()
+            except sqlite3.Error as error:
+                # E.g. the table is locked by a write; the next check tries again
+                self._report_error(username, error)
+                continue
+            if username == self._requested:
+                # Bound now, the loop rebinds `username` before the dispatch may run
+                self.dispatch(partial(self._answered, username, row is None))
+
+    def _report_error(self, username: Optional[str], error: sqlite3.Error) -> None:
+        if username is not None and username == self._requested:
+            self.dispatch(partial(self._failed, username, str(error)))
+
+    def _answered(self, username: str, available: bool) -> None:
+        if username != self._requested:
+            return  # The user kept typing, a newer check is on its way
+        self.username = username
+        self.available = available
+        self.error = None
+        self.trigger_event("availability_changed")
+
+    def _failed(self, username: str, error: str) -> None:
+        if username != self._requested:
+            return
+        self.username = username
+        self.available = None
+        self.error = error
+        self.trigger_event("availability_failed")
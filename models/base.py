@@ -1,3 +1,4 @@
+import time
 from typing import Callable, TypeVar, Any
 
 Self = TypeVar("Self", bound="ObservableModel")
@@ -12,6 +13,9 @@ class ObservableModel:
     react to the changes.
     """
 
+    # Optional diagnostics.events.EventProfiler (or compatible) shared by all models
+    profiler: Any = None
+
     def __init__(self):
         self._event_listeners: dict[str, list[Callable[[Any], None]]] = {}
 
@@ -40,5 +44,23 @@ class ObservableModel:
         if event not in self._event_listeners.keys():
             return
 
+        if self.profiler is not None:
+            self._trigger_profiled_event(event)
+            return
+
         for func in self._event_listeners[event]:
             func(self)
+
+    def _trigger_profiled_event(self, event: str) -> None:
+        """Same as `trigger_event`, but reports the time spent in every listener."""
+        key = f"{type(self).__name__}:{event}"
+        listeners = self._event_listeners[event]
+        started = time.perf_counter()
+        for func in listeners:
+            called = time.perf_counter()
+            func(self)
+            name = getattr(func, "__qualname__", None) or repr(func)
+            self.profiler.listener_called(key, name, time.perf_counter() - called)
+        self.profiler.event_dispatched(
+            key, len(listeners), time.perf_counter() - started
+        )
@@ -1,6 +1,17 @@
+from typing import Optional
+
 from .auth import Auth
+from .availability import UsernameAvailability
+from .user_store import UserStore
 
 
 class Model:
-    def __init__(self):
-        self.auth = Auth()
+    def __init__(self, user_store: Optional[UserStore] = None):
+        """
+        Args:
+            user_store (UserStore, optional): Store of the accounts. Defaults to the
+                database at `user_store.DEFAULT_PATH`.
+        """
+        store = user_store or UserStore()
+        self.auth = Auth(store)
+        self.availability = UsernameAvailability(store)
@@ -0,0 +1,102 @@
+import hashlib
+import hmac
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# scrypt cost parameters of new hashes; stored with every hash so they can be raised
+SCRYPT_N = 2**14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+
+def hash_password(password: str, n: int = SCRYPT_N) -> str:
+    """Returns a salted scrypt hash of the password, encoded with its parameters.
+
+    The format is "scrypt$n$r$p$salt$hash", with the salt and hash in hex.
+
+    Args:
+        password (str): Password to hash.
+        n (int): scrypt CPU/memory cost, a power of 2. Only lowered for benchmarks.
+    """
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=n, r=SCRYPT_R, p=SCRYPT_P)
+    return f"scrypt${n}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    """Checks a password against a hash made by `hash_password`."""
+    try:
+        algorithm, n, r, p, salt, expected = encoded.split("$")
+    except ValueError:
+        return False
+    if algorithm != "scrypt":
+        return False
+    digest = hashlib.scrypt(
+        password.encode(), salt=bytes.fromhex(salt), n=int(n), r=int(r), p=int(p)
+    )
+    return hmac.compare_digest(digest, bytes.fromhex(expected))
+
+
+# Hashing runs in worker processes, so neither the GUI thread nor the GIL is held
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def executor() -> ProcessPoolExecutor:
+    """Returns the process pool used for hashing, starting it on first use.
+
+    Workers are spawned rather than forked, since forking a process running Tk and
+    worker threads is unsafe. The pool has one worker per CPU core.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def _submit(fn: Callable[..., T], *args: Any) -> "Future[T]":
+    """Submits to the pool, replacing it once if a worker died and broke it."""
+    global _executor
+    try:
+        return executor().submit(fn, *args)
+    except BrokenProcessPool:
+        _executor = None
+        return executor().submit(fn, *args)
+
+
+def start() -> None:
+    """Starts a worker process in the background, so the first hash does not wait for it."""
+    _submit(int)
+
+
+def hash_password_async(password: str, n: int = SCRYPT_N) -> "Future[str]":
+    """Same as `hash_password`, run in the process pool."""
+    return _submit(hash_password, password, n)
+
+
+def verify_password_async(password: str, encoded: str) -> "Future[bool]":
+    """Same as `verify_password`, run in the process pool."""
+    return _submit(verify_password, password, encoded)
+
+
+def hash_passwords(passwords: Iterable[str], n: int = SCRYPT_N) -> list[str]:
+    """Hashes many passwords on all cores, e.g. to import accounts. Blocks until done."""
+    passwords = list(passwords)
+    workers = os.cpu_count() or 1
+    chunksize = max(len(passwords) // (workers * 4), 1)
+    return list(
+        executor().map(hash_password, passwords, repeat(n), chunksize=chunksize)
+    )
+
+
+def shutdown() -> None:
+    """Stops the worker processes, if they were started."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
@@ -0,0 +1,99 @@
+import os
+import sqlite3
+import threading
+import urllib.parse
+from typing import Iterable, Optional, TypedDict
+
+# Default location of the user database, shared by all runs of the app
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".tkinter_mvc", "users.sqlite3")
+
+# The username is the primary key of a WITHOUT ROWID table, so rows are stored in a
+# B-tree ordered by username and a lookup is O(log n) with no separate index to visit
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY NOT NULL,
+    fullname TEXT NOT NULL,
+    password_hash TEXT NOT NULL
+) WITHOUT ROWID
+"""
+SELECT_USER = "SELECT username, fullname, password_hash FROM users WHERE username = ?"
+SELECT_USERNAME = "SELECT 1 FROM users WHERE username = ?"
+INSERT_USER = "INSERT INTO users (username, fullname, password_hash) VALUES (?, ?, ?)"
+INSERT_NEW_USERS = (
+    "INSERT OR IGNORE INTO users (username, fullname, password_hash) VALUES (?, ?, ?)"
+)
+
+
+class UserRecord(TypedDict):
+    username: str
+    fullname: str
+    password_hash: str
+
+
+class UserStore:
+    """Accounts persisted in a local SQLite database.
+
+    One connection is opened for the lifetime of the store. The SQL statements are
+    constants, so the connection's statement cache compiles each of them once and
+    every later call reuses the prepared statement. The database uses write-ahead
+    logging, so other processes can read while it is written.
+
+    The store can be used from any thread: the connection is shared, with a lock
+    around every use, since `Auth` may store accounts from the hashing pool's
+    result thread.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """
+        Args:
+            path (str): Database file, created if missing. ":memory:" keeps the
+                accounts in memory, e.g. for benchmarks.
+        """
+        if path == ":memory:":
+            # Shared cache, so connections from `connect` see the same database
+            self._uri = f"file:users-{id(self)}?mode=memory&cache=shared"
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._uri = f"file:{urllib.parse.quote(os.path.abspath(path))}"
+        self.path = path
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        with self.connection:
+            self.connection.execute(SCHEMA)
+
+    def connect(self) -> sqlite3.Connection:
+        """Opens a new connection to the database, e.g. for use by another thread."""
+        return sqlite3.connect(self._uri, uri=True)
+
+    def get(self, username: str) -> Optional[UserRecord]:
+        with self._lock:
+            row = self.connection.execute(SELECT_USER, (username,)).fetchone()
+        if row is None:
+            return None
+        return {"username": row[0], "fullname": row[1], "password_hash": row[2]}
+
+    def add(self, record: UserRecord) -> bool:
+        """Stores a new account. Returns False if the username is already taken."""
+        row = (record["username"], record["fullname"], record["password_hash"])
+        try:
+            with self._lock, self.connection:
+                self.connection.execute(INSERT_USER, row)
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def add_many(self, records: Iterable[UserRecord]) -> int:
+        """Stores accounts in one transaction, skipping taken usernames.
+
+        Meant for imports, with the hashes made by `passwords.hash_passwords`.
+        Returns the number of accounts added.
+        """
+        rows = ((r["username"], r["fullname"], r["password_hash"]) for r in records)
+        with self._lock, self.connection:
+            return self.connection.executemany(INSERT_NEW_USERS, rows).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
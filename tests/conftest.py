@@ -0,0 +1,68 @@
+"""Fixtures driving the app with `HeadlessView`, so the tests need no display."""
+import time
+from typing import Callable, Iterator
+
+import pytest
+
+from controllers.init_controller import Controller
+from models import passwords
+from models.init_model import Model
+from models.passwords import hash_password
+from models.user_store import UserStore
+from views.headless import HeadlessView
+
+
+@pytest.fixture(scope="session", autouse=True)
+def password_pool() -> Iterator[None]:
+    """Stops the hashing worker processes once all tests are done."""
+    yield
+    passwords.shutdown()
+
+
+@pytest.fixture
+def store() -> Iterator[UserStore]:
+    """In-memory user store holding the account "alice" with the password "pw"."""
+    store = UserStore(":memory:")
+    # A minimal scrypt cost keeps signing in fast
+    store.add(
+        {
+            "username": "alice",
+            "fullname": "Alice",
+            "password_hash": hash_password("pw", n=2),
+        }
+    )
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def start_app(store: UserStore) -> Iterator[Callable[..., Controller]]:
+    """Returns a function starting the app on `store`, with the given view options."""
+    views: list[HeadlessView] = []
+
+    def start(**view_options) -> Controller:
+        view = HeadlessView(**view_options)
+        views.append(view)
+        controller = Controller(Model(store), view)
+        controller.start()
+        return controller
+
+    yield start
+    for view in views:
+        view.root.destroy()
+
+
+def wait_until(
+    view: HeadlessView, condition: Callable[[], bool], timeout: float = 10.0
+):
+    """Runs the view's due callbacks until `condition` holds.
+
+    Raises:
+        AssertionError: If `condition` still does not hold after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError(f"Timed out after {timeout} seconds")
+        view.root.update()
+        time.sleep(0.001)
@@ -0,0 +1,202 @@
+"""Sign up, sign in, hibernation and the username check, driven through HeadlessView."""
+import sqlite3
+import time
+
+from conftest import wait_until
+
+
+def sign_in(controller, username: str, password: str) -> None:
+    frame = controller.view.get_frame("signin")
+    frame.username_input.insert(0, username)
+    frame.password_input.insert(0, password)
+    frame.signin_btn.invoke()
+
+
+def fill_signup(controller, fullname: str, username: str, password: str) -> None:
+    controller.view.switch("signup")
+    frame = controller.view.frames["signup"]
+    frame.fullname_input.insert(0, fullname)
+    frame.username_input.insert(0, username)
+    frame.password_input.insert(0, password)
+
+
+def test_sign_in_and_out(start_app):
+    controller = start_app()
+    view = controller.view
+    assert view.current == "signin"
+
+    sign_in(controller, "alice", "pw")
+    wait_until(view, lambda: view.current == "home")
+    assert controller.model.auth.current_user == {"username": "alice"}
+    wait_until(view, lambda: view.frames["home"].greeting["text"] == "Welcome, alice!")
+
+    view.frames["home"].signout_btn.invoke()
+    assert view.current == "signin"
+    assert not controller.model.auth.is_logged_in
+
+
+def test_sign_in_with_wrong_password(start_app):
+    controller = start_app()
+    view = controller.view
+    sign_in(controller, "alice", "wrong")
+    frame = view.frames["signin"]
+    wait_until(view, lambda: frame.message["text"] == "Invalid username or password")
+    assert view.current == "signin"
+    assert frame.signin_btn["state"] == "normal"
+    assert frame.password_input.get() == ""
+
+
+def test_sign_in_with_unknown_user(start_app):
+    controller = start_app()
+    view = controller.view
+    sign_in(controller, "bob", "pw")
+    frame = view.frames["signin"]
+    wait_until(view, lambda: frame.message["text"] == "Invalid username or password")
+
+
+def test_sign_up(start_app, store):
+    controller = start_app()
+    view = controller.view
+    fill_signup(controller, "Bob", "bob", "secret")
+    frame = view.frames["signup"]
+
+    frame.signup_btn.invoke()
+    wait_until(view, lambda: frame.message["text"] != "")
+    assert frame.message["text"] == "Please agree to the Terms & Conditions"
+
+    frame.agreement.invoke()
+    frame.signup_btn.invoke()
+    wait_until(view, lambda: view.current == "home")
+    assert store.get("bob")["fullname"] == "Bob"
+    assert frame.username_input.get() == frame.fullname_input.get() == ""
+    assert not frame.has_agreed.get()
+
+
+def test_sign_up_with_taken_username(start_app):
+    controller = start_app()
+    view = controller.view
+    fill_signup(controller, "Alice", "alice", "secret")
+    frame = view.frames["signup"]
+    frame.agreement.invoke()
+    frame.signup_btn.invoke()
+    wait_until(view, lambda: frame.message["text"] != "")
+    assert frame.message["text"] == "The username alice is already taken"
+    assert view.current == "signup"
+
+
+def test_hibernated_form_keeps_its_input_but_not_passwords(start_app):
+    controller = start_app(max_live_frames=2)
+    view = controller.view
+    fill_signup(controller, "Bob", "bob", "secret")
+    view.frames["signup"].has_agreed.set(True)
+
+    view.switch("signin")
+    view.switch("home")
+    assert "signup" not in view.frames
+    assert view.frame_stats()["signup"]["state"] == "hibernated"
+
+    view.switch("signup")
+    frame = view.frames["signup"]
+    assert frame.fullname_input.get() == "Bob"
+    assert frame.username_input.get() == "bob"
+    assert frame.password_input.get() == ""
+    assert frame.has_agreed.get()
+    # The rebuilt frame is bound to its controller again
+    frame.signin_btn.invoke()
+    assert view.current == "signin"
+
+
+def test_sign_up_clears_a_hibernated_form(start_app):
+    # Switching to home hibernates the signup frame before its controller hears of
+    # the new account
+    controller = start_app(max_live_frames=1)
+    view = controller.view
+    fill_signup(controller, "Bob", "bob", "secret")
+    view.frames["signup"].agreement.invoke()
+    view.frames["signup"].signup_btn.invoke()
+    wait_until(view, lambda: view.current == "home")
+    assert "signup" not in view.frames
+
+    view.frames["home"].signout_btn.invoke()
+    view.switch("signup")
+    frame = view.frames["signup"]
+    assert frame.fullname_input.get() == frame.username_input.get() == ""
+    assert not frame.has_agreed.get()
+
+
+def test_prewarmed_frames_are_not_hibernated_right_away(start_app):
+    controller = start_app(hibernate_after=60)
+    view = controller.view
+    view.root.drain()
+    assert {"home", "signup"} <= set(view.frames)
+
+    view.switch("signin")
+    assert set(view.frames) == {"signin", "home", "signup"}
+
+
+def test_frames_hibernate_after_a_while(start_app):
+    controller = start_app(hibernate_after=0.01)
+    view = controller.view
+    view.root.drain()
+    time.sleep(0.02)
+    view.switch("signin")
+    assert set(view.frames) == {"signin"}
+
+
+def test_username_availability(start_app):
+    controller = start_app()
+    view = controller.view
+    view.switch("signup")
+    frame = view.frames["signup"]
+    signup = controller.signup_controller
+
+    frame.username_input.insert(0, "alice")
+    signup.on_username_changed()
+    wait_until(view, lambda: frame.username_status["text"] == "Already taken")
+
+    frame.username_input.insert(0, "2")
+    signup.on_username_changed()
+    wait_until(view, lambda: frame.username_status["text"] == "Available")
+
+    frame.username_input.delete(0, "end")
+    signup.on_username_changed()
+    wait_until(view, lambda: frame.username_status["text"] == "")
+
+
+def test_username_check_that_fails(start_app, store, monkeypatch):
+    def connect():
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr(store, "connect", connect)
+    controller = start_app()
+    view = controller.view
+    view.switch("signup")
+    frame = view.frames["signup"]
+
+    frame.username_input.insert(0, "bob")
+    controller.signup_controller.on_username_changed()
+    wait_until(
+        view, lambda: frame.username_status["text"] == "Could not check the username"
+    )
+    assert controller.model.availability.error == "unable to open database file"
+
+    # The next check starts a new lookup thread
+    monkeypatch.undo()
+    controller.signup_controller.on_username_changed()
+    wait_until(view, lambda: frame.username_status["text"] == "Available")
+
+
+def test_username_check_pending_when_hibernated(start_app, monkeypatch):
+    controller = start_app(max_live_frames=1)
+    view = controller.view
+    view.root.drain()  # Prewarming, which would build the frame again
+    checked = []
+    monkeypatch.setattr(controller.model.availability, "check", checked.append)
+    view.switch("signup")
+    view.frames["signup"].username_input.insert(0, "bob")
+    controller.signup_controller.on_username_changed()
+
+    view.switch("signin")
+    assert "signup" not in view.frames
+    view.root.drain()
+    assert checked == []
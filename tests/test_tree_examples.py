@@ -0,0 +1,135 @@
+"""PathIndex and SelectionTrie of the tree view examples, as in the latest example."""
+import importlib.util
+import os
+import threading
+
+import pytest
+
+TREE_EXAMPLE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tree view examples",
+    "tree example 18 with time slicing.py",
+)
+
+
+@pytest.fixture(scope="module")
+def example():
+    spec = importlib.util.spec_from_file_location("tree_example", TREE_EXAMPLE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for path in (
+        "campaign/kalo.txt",
+        "campaign/kalibration.csv",
+        "campaign/run 1/data.txt",
+        "campaign/run 1/data.bin",
+        "limits/en55032.txt",
+        "limits/.hidden.txt",
+        "kalo/readme.md",
+    ):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("x")
+    return tmp_path
+
+
+@pytest.fixture
+def index(example, tree):
+    index = example.PathIndex(tree)
+    index.refresh()
+    return index
+
+
+def test_index_skips_hidden_files(index):
+    assert len(index) == 10  # 7 files and 3 folders, without the hidden file
+    assert index.search("hidden") == []
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("data", ["campaign/run 1/data.bin", "campaign/run 1/data.txt"]),
+        ("run data.txt", ["campaign/run 1/data.txt"]),
+        ("DATA.BIN", ["campaign/run 1/data.bin"]),
+        ("*.csv", ["campaign/kalibration.csv"]),
+        ("ka*", ["campaign/kalibration.csv", "campaign/kalo.txt", "kalo"]),
+        ("ka*.txt", ["campaign/kalo.txt"]),
+        ("kalo/*", ["kalo/readme.md"]),
+        ("campaign/*/*.txt", ["campaign/run 1/data.txt"]),
+        ("e?55*", ["limits/en55032.txt"]),
+        ("xyz", []),
+        ("", []),
+    ],
+)
+def test_search(index, query, expected):
+    assert sorted(index.search(query)) == expected
+
+
+def test_search_limit_and_cancel(index):
+    assert len(index.search("a", limit=2)) == 2
+    cancelled = threading.Event()
+    cancelled.set()
+    assert index.search("a", cancelled=cancelled) == []
+
+
+def test_refresh_picks_up_changes(index, tree):
+    (tree / "campaign" / "kalo.txt").unlink()
+    (tree / "limits" / "new.txt").write_text("x")
+    index.refresh()
+    assert index.search("kalo.txt") == []
+    assert index.search("new") == ["limits/new.txt"]
+
+    # Only the changed folder is listed again
+    (tree / "campaign" / "run 1" / "data.bin").unlink()
+    index.refresh("campaign/run 1")
+    assert index.search("data") == ["campaign/run 1/data.txt"]
+
+
+def test_selection_of_files(example, tree):
+    selection = example.SelectionTrie()
+    selection.add(tree / "campaign/kalo.txt")
+    selection.add(tree / "limits/en55032.txt")
+    selection.add(tree / "limits/en55032.txt")
+    assert len(selection) == 2
+    assert tree / "campaign/kalo.txt" in selection
+    assert tree / "campaign/kalibration.csv" not in selection
+
+    selection.discard(tree / "campaign/kalo.txt")
+    assert len(selection) == 1
+    assert list(selection) == [str(tree / "limits/en55032.txt")]
+    with pytest.raises(KeyError):
+        selection.remove(tree / "campaign/kalo.txt")
+
+
+def test_selection_of_folders(example, tree):
+    campaign = tree / "campaign"
+    selection = example.SelectionTrie()
+    selection.add_folder(campaign, file_count=4)
+    assert len(selection) == 4
+    assert campaign / "run 1/data.bin" in selection
+    assert selection.folder_state(campaign) is True
+    assert selection.folder_state(tree / "limits") is False
+
+    selection.discard(campaign / "run 1/data.bin")
+    assert len(selection) == 3
+    assert selection.folder_state(campaign) is None
+    assert selection.count(campaign) == 3
+    assert sorted(selection) == [
+        str(campaign / "kalibration.csv"),
+        str(campaign / "kalo.txt"),
+        str(campaign / "run 1/data.txt"),
+    ]
+    assert list(selection.marks()) == [
+        (campaign, True),
+        (campaign / "run 1/data.bin", False),
+    ]
+
+    selection.discard_folder(campaign, file_count=4)
+    assert len(selection) == 0
+    assert not selection
+    assert (
+        list(selection.marks()) == []
+    )  # The mark is pruned, nothing is selected above
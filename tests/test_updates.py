@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from views.headless import HeadlessLabel, HeadlessRoot
+from views.updates import UpdateScheduler
+
+
+class CountingLabel(HeadlessLabel):
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.calls = 0
+
+    def configure(self, **options):
+        self.calls += 1
+        super().configure(**options)
+
+
+@pytest.fixture
+def root():
+    root = HeadlessRoot()
+    yield root
+    root.destroy()
+
+
+def test_changes_are_applied_once_per_flush(root):
+    updates = UpdateScheduler(root)
+    label = CountingLabel(root)
+    for i in range(100):
+        updates.set(label, text=str(i))
+    assert label["text"] == ""
+
+    root.drain()
+    assert label["text"] == "99"
+    assert label.calls == 1
+
+
+def test_unchanged_values_are_not_applied(root):
+    updates = UpdateScheduler(root)
+    label = CountingLabel(root)
+    updates.set(label, text="a", fg="red")
+    root.drain()
+    updates.set(label, text="a")
+    updates.set(label, fg="red")
+    root.drain()
+    assert label.calls == 1
+
+    # Set back to the applied value before the flush
+    updates.set(label, text="b")
+    updates.set(label, text="a")
+    root.drain()
+    assert label.calls == 1
+
+
+def test_forget_after_direct_configure(root):
+    updates = UpdateScheduler(root)
+    label = CountingLabel(root)
+    updates.set(label, text="a")
+    root.drain()
+    label.configure(text="b")
+    updates.forget(label)
+    updates.set(label, text="a")
+    root.drain()
+    assert label["text"] == "a"
+
+
+def test_set_from_an_unwatched_thread(root):
+    updates = UpdateScheduler(root)
+    label = CountingLabel(root)
+    errors = []
+
+    def work():
+        try:
+            updates.set(label, text="a")
+        except RuntimeError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+    assert len(errors) == 1
+
+
+def test_set_from_a_watched_thread(root):
+    updates = UpdateScheduler(root, interval_ms=0)
+    label = CountingLabel(root)
+    thread = threading.Thread(target=lambda: updates.set(label, text="done"))
+    updates.watch(thread)
+    thread.start()
+    thread.join()
+
+    root.drain()  # Polls until the thread has ended, then stops
+    assert label["text"] == "done"
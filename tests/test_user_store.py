@@ -0,0 +1,92 @@
+import threading
+
+from models.auth import Auth
+from models.passwords import hash_password, verify_password
+from models.user_store import UserStore
+
+
+def record(username: str, fullname: str = "") -> dict:
+    return {"username": username, "fullname": fullname, "password_hash": "x"}
+
+
+def test_add_and_get(store):
+    assert store.add(record("bob", "Bob"))
+    assert store.get("bob") == {
+        "username": "bob",
+        "fullname": "Bob",
+        "password_hash": "x",
+    }
+    assert store.get("carol") is None
+
+
+def test_add_taken_username(store):
+    assert not store.add(record("alice", "Someone else"))
+    assert store.get("alice")["fullname"] == "Alice"
+
+
+def test_add_many_skips_taken_usernames(store):
+    assert store.add_many([record("alice"), record("bob"), record("carol")]) == 2
+    assert store.get("carol") is not None
+
+
+def test_file_database_persists(tmp_path):
+    path = str(tmp_path / "users.sqlite3")
+    store = UserStore(path)
+    store.add(record("bob"))
+    store.close()
+
+    store = UserStore(path)
+    assert store.get("bob") is not None
+    store.close()
+
+
+def test_use_from_other_threads(store):
+    def add():
+        name = threading.current_thread().name
+        store.add(record(name))
+        found.append(store.get(name) is not None)
+
+    found: list[bool] = []
+    threads = [threading.Thread(target=add, name=f"user{i}") for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert found == [True] * 8
+
+
+def test_connect_sees_the_same_database(store):
+    connection = store.connect()
+    store.add(record("bob"))
+    count = connection.execute("SELECT count(*) FROM users").fetchone()[0]
+    connection.close()
+    assert count == 2
+
+
+def test_password_hashes():
+    encoded = hash_password("secret", n=2)
+    assert encoded.startswith("scrypt$2$")
+    assert verify_password("secret", encoded)
+    assert not verify_password("Secret", encoded)
+    assert not verify_password("secret", "md5$abc")
+    assert hash_password("secret", n=2) != encoded  # Salted
+
+
+def test_auth_events(store):
+    auth = Auth(store)
+    events = []
+    for event in ("auth_pending", "auth_changed", "auth_failed"):
+        auth.add_event_listener(event, lambda auth, event=event: events.append(event))
+    done = threading.Event()
+    auth.add_event_listener("auth_changed", lambda auth: done.set())
+
+    auth.login("alice", "pw")
+    assert done.wait(10)
+    assert events == ["auth_pending", "auth_pending", "auth_changed"]
+    assert auth.is_logged_in and not auth.is_pending
+
+    auth.logout()
+    assert auth.current_user is None
+
+    auth.signup("", "pw")
+    assert auth.error == "Username and password are required"
@@ -0,0 +1,200 @@
+"""Builds the app into a single zipapp and compares its cold start with the source tree.
+
+Importing from `models/`, `views/` and `controllers/` costs several stat and open calls
+per module, which add up on network mounted installs. The bundle is one file holding
+bytecode only: modules are compiled at build time to unchecked hash based .pyc files,
+so nothing is compiled, stat'ed or checked against its source at startup. Its
+`__main__` then imports the modules needed for the first window in a fixed order,
+recorded at build time, before starting the app.
+
+Usage:
+    python -m tools.bundle build dist/app.pyz
+    python dist/app.pyz
+    python -m tools.bundle measure dist/app.pyz --runs 10
+"""
+import argparse
+import importlib.util
+import json
+import marshal
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages and modules of the app, relative to the repository root
+SOURCES = ("main.py", "models", "views", "controllers", "diagnostics")
+
+# Factories resolved before the first window shows, see Controller.start
+STARTUP_FACTORIES = ("views.signin:SignInView", "controllers.signin:SignInController")
+
+MAIN = """\
+# Generated by tools/bundle.py
+import importlib
+
+# Modules imported before the first window shows, in the order they were first imported
+IMPORT_ORDER = {order!r}
+
+# Password hashing workers are spawned and import this module as "__mp_main__"
+if __name__ == "__main__":
+    for name in IMPORT_ORDER:
+        importlib.import_module(name)
+
+    from main import main
+
+    main()
+"""
+
+# Imports what the app imports up to its first window, then prints the module names
+RECORD_IMPORTS = f"""
+import json, sys
+before = set(sys.modules)
+from models.init_model import Model
+from views.init_view import View, import_factory
+from controllers.init_controller import Controller
+for factory in {STARTUP_FACTORIES!r}:
+    import_factory(factory)
+print(json.dumps([name for name in sys.modules if name not in before]))
+"""
+
+
+def source_files() -> list[str]:
+    """Returns the paths of the app's Python files, relative to the repository root."""
+    files = []
+    for source in SOURCES:
+        if source.endswith(".py"):
+            files.append(source)
+            continue
+        for parent, folders, names in os.walk(os.path.join(ROOT, source)):
+            folders[:] = [folder for folder in folders if folder != "__pycache__"]
+            files.extend(
+                os.path.relpath(os.path.join(parent, name), ROOT)
+                for name in sorted(names)
+                if name.endswith(".py")
+                and name[:-3].isidentifier()  # Skip scratch scripts
+            )
+    return files
+
+
+def bytecode(path: str, source: bytes) -> bytes:
+    """Returns the contents of an unchecked hash based .pyc file for a module."""
+    code = compile(source, path, "exec", dont_inherit=True)
+    flags = 0b01  # Hash based, source not checked
+    return (
+        importlib.util.MAGIC_NUMBER
+        + flags.to_bytes(4, "little")
+        + importlib.util.source_hash(source)
+        + marshal.dumps(code)
+    )
+
+
+def record_import_order() -> list[str]:
+    """Returns the app modules imported before the first window, in import order."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", RECORD_IMPORTS], cwd=ROOT, text=True
+    )
+    packages = tuple(source.removesuffix(".py") for source in SOURCES)
+    return [name for name in json.loads(output) if name.partition(".")[0] in packages]
+
+
+def build(output: str) -> int:
+    """Writes the bundle to `output` and returns its size in bytes."""
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    packages = set()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as bundle:
+        for path in source_files():
+            with open(os.path.join(ROOT, path), "rb") as f:
+                source = f.read()
+            bundle.writestr(path.replace(os.sep, "/") + "c", bytecode(path, source))
+            packages.add(os.path.dirname(path))
+
+        # Namespace packages are not found in zip files, give each an empty __init__
+        for package in sorted(packages - {""}):
+            init = f"{package}/__init__.pyc".replace(os.sep, "/")
+            if init not in bundle.namelist():
+                bundle.writestr(init, bytecode(init, b""))
+
+        main = MAIN.format(order=tuple(record_import_order()))
+        bundle.writestr("__main__.py", main)
+
+    # Same first line as zipapp, so the bundle can be run directly on POSIX systems
+    with open(output, "rb") as f:
+        archive = f.read()
+    with open(output, "wb") as f:
+        f.write(b"#!/usr/bin/env python3\n" + archive)
+    os.chmod(output, 0o755)
+    return len(archive)
+
+
+def time_start(command: list[str], cwd: str) -> float:
+    """Returns the wall time in seconds of starting the app until its window is usable."""
+    started = time.perf_counter()
+    subprocess.run(command, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def measure(bundle: str, runs: int) -> dict[str, dict[str, float]]:
+    """Times cold starts of the source tree and of the bundle.
+
+    The first run of each is reported separately since it is the one that reads
+    from disk or the network; later runs come from the OS file cache. Without a
+    display, only the imports up to the first window are timed.
+    """
+    bundle = os.path.abspath(bundle)
+    try:
+        import tkinter
+
+        tkinter.Tk().destroy()
+        flags = ["--exit-when-ready"]
+        commands = {
+            "source tree": [sys.executable, "main.py", *flags],
+            "bundle": [sys.executable, bundle, *flags],
+        }
+    except Exception:
+        print("No display, timing imports only")
+        imports = "import sys; sys.path.insert(0, {!r}); exec({!r})"
+        commands = {
+            "source tree": [sys.executable, "-c", imports.format(ROOT, RECORD_IMPORTS)],
+            "bundle": [sys.executable, "-c", imports.format(bundle, RECORD_IMPORTS)],
+        }
+
+    results = {}
+    with tempfile.TemporaryDirectory() as empty:
+        for name, command in commands.items():
+            # The bundle runs from a directory without the sources next to it
+            cwd = ROOT if name == "source tree" else empty
+            timings = [time_start(command, cwd) for _ in range(runs)]
+            results[name] = {
+                "first_ms": timings[0] * 1000,
+                "median_ms": statistics.median(timings[1:] or timings) * 1000,
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="build the bundle")
+    build_parser.add_argument("output", nargs="?", default="dist/app.pyz")
+    measure_parser = commands.add_parser("measure", help="compare cold start times")
+    measure_parser.add_argument("bundle", nargs="?", default="dist/app.pyz")
+    measure_parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        size = build(args.output)
+        print(f"Wrote {args.output} ({size / 1024:.0f} KiB)")
+        return
+
+    results = measure(args.bundle, args.runs)
+    print(f"{'':<12} {'first ms':>9} {'median ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<12} {result['first_ms']:>9.1f} {result['median_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
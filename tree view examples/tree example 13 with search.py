@@ -0,0 +1,482 @@
+import fnmatch
+import os
+import re
+import threading
+import tkinter as tk
+from array import array
+from tkinter import ttk
+from pathlib import Path
+
+
+class PathIndex:
+    """Trigram index over every (non-hidden) path below a root folder.
+
+    Paths are stored once, relative to the root, and every lower-cased path is broken into
+    trigrams. Each trigram maps to a compact array of path ids, so a query only has to look
+    at the paths sharing its rarest trigram instead of scanning the whole tree. Paths are
+    indexed as ``/path\n`` plus the first two letters of the file name after a NUL, so
+    globs, which are anchored, have trigrams like ``\0ka`` or ``txt\n`` even when their
+    literal parts are short.
+
+    The index is built by a background thread and refreshed incrementally: directories whose
+    modification time has not changed since the last walk are not listed again.
+    """
+
+    GLOB_CHARS = re.compile(r'[*?\[]')
+    GLOB_WILDCARDS = re.compile(r'\[[^\]]*\]|[*?]')
+    COMPACT_RATIO = 0.25  # Rebuild the postings once a quarter of the paths are stale
+
+    def __init__(self, root_path):
+        self.root_path = Path(root_path)
+        self.lock = threading.Lock()
+        self.paths = []  # Relative path of each id, None once removed
+        self.lowered = []  # Lower-cased copy used for matching
+        self.postings = {}  # trigram -> array of path ids
+        self.path_ids = {}  # relative path -> id
+        self.listings = {}  # relative dir -> (mtime_ns, names of its children) at the last listing
+        self.removed = 0
+        self.ready = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._worker = None
+
+    def __len__(self):
+        return len(self.path_ids)
+
+    def refresh_async(self, on_done=None):
+        """Walk the root folder on a background thread, only listing changed directories."""
+        if self._worker and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._refresh, args=(on_done,), daemon=True)
+        self._worker.start()
+
+    def _refresh(self, on_done):
+        self.refresh()
+        self.ready.set()
+        if on_done:
+            on_done()
+
+    def refresh(self, relative_dir=''):
+        """Synchronously bring the index up to date for a folder and everything below it."""
+        with self._refresh_lock:
+            pending = [relative_dir]
+            while pending:
+                rel_dir = pending.pop()
+                prefix = rel_dir + '/' if rel_dir else ''
+                try:
+                    mtime = (self.root_path / rel_dir).stat().st_mtime_ns
+                except OSError:
+                    self._replace_children(rel_dir, {}, None)
+                    continue
+
+                listing = self.listings.get(rel_dir)
+                if listing and listing[0] == mtime:
+                    # Listing unchanged; only the already known sub folders need a look
+                    pending.extend(prefix + name for name, is_dir in listing[1].items() if is_dir)
+                    continue
+
+                children = {}
+                try:
+                    for entry in os.scandir(self.root_path / rel_dir):
+                        if entry.name.startswith('.'):
+                            continue  # Skip hidden files
+                        try:
+                            children[entry.name] = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            children[entry.name] = False
+                except OSError:
+                    continue  # Skip folders that cannot be accessed
+
+                self._replace_children(rel_dir, children, mtime)
+                pending.extend(prefix + name for name, is_dir in children.items() if is_dir)
+
+    def _replace_children(self, rel_dir, children, mtime):
+        """Swap the indexed direct children of a folder for a fresh listing."""
+        prefix = rel_dir + '/' if rel_dir else ''
+        with self.lock:
+            known = self.listings.pop(rel_dir, (None, {}))[1]
+            for name in known.keys() - children.keys():
+                self._remove_locked(prefix + name)
+                if known[name]:
+                    self._forget_dir_locked(prefix + name)
+            for name in sorted(children.keys() - known.keys()):
+                self._add_locked(prefix + name)
+            if mtime is not None:
+                self.listings[rel_dir] = (mtime, children)
+            self._maybe_compact_locked()
+
+    def _forget_dir_locked(self, rel_dir):
+        """Forget a removed folder and everything that was indexed below it."""
+        known = self.listings.pop(rel_dir, (None, {}))[1]
+        for name, is_dir in known.items():
+            self._remove_locked(f'{rel_dir}/{name}')
+            if is_dir:
+                self._forget_dir_locked(f'{rel_dir}/{name}')
+
+    def _add_locked(self, rel_path):
+        path_id = len(self.paths)
+        lowered = rel_path.lower()
+        self.paths.append(rel_path)
+        self.lowered.append(lowered)
+        self.path_ids[rel_path] = path_id
+        name = lowered.rpartition('/')[2]
+        for trigram in self.trigrams(f'/{lowered}\n') | {f'\0{name}\n'[:3]}:
+            try:
+                self.postings[trigram].append(path_id)
+            except KeyError:
+                self.postings[trigram] = array('I', (path_id,))
+
+    def _remove_locked(self, rel_path):
+        path_id = self.path_ids.pop(rel_path, None)
+        if path_id is not None:
+            self.paths[path_id] = None
+            self.lowered[path_id] = None
+            self.removed += 1
+
+    def _maybe_compact_locked(self):
+        """Drop stale ids once enough paths have been removed."""
+        if self.removed <= len(self.paths) * self.COMPACT_RATIO:
+            return
+        live = sorted(self.path_ids)
+        self.paths, self.lowered, self.postings, self.path_ids = [], [], {}, {}
+        self.removed = 0
+        for rel_path in live:
+            self._add_locked(rel_path)
+
+    @staticmethod
+    def trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def search(self, query, limit=200, cancelled=None):
+        """Return up to ``limit`` relative paths matching the query.
+
+        Whitespace separated terms must all appear in the path, in any order. A term
+        containing ``*``, ``?`` or ``[`` is a glob matched against the file name, or against
+        the whole relative path when it contains a ``/``. Setting the ``cancelled`` event
+        stops the search early; whatever was found so far is returned.
+        """
+        terms = query.lower().split()
+        if not terms:
+            return []
+
+        matchers = []
+        literals = []
+        for term in terms:
+            if self.GLOB_CHARS.search(term):
+                matchers.append(self._glob_matcher(term))
+                parts = self.GLOB_WILDCARDS.split(term)
+                # Globs match a whole name or path, so their ends are anchored
+                start = '/' if '/' in term else '\0'
+                parts[0] = start + parts[0] if parts[0] else ''
+                parts[-1] = parts[-1] + '\n' if parts[-1] else ''
+                literals.extend(part for part in parts if part)
+            else:
+                matchers.append(lambda p, t=term: t in p)
+                literals.append(term)
+        trigrams = set().union(*map(self.trigrams, literals))
+        short = {literal for literal in literals if len(literal) < 3}
+
+        with self.lock:
+            postings = [self.postings.get(t) for t in trigrams]
+            if any(p is None for p in postings):
+                return []  # A required trigram never occurs
+            for literal in short:
+                ids = self._containing_locked(literal)
+                if ids is not None:
+                    postings.append(ids)
+            if postings:
+                candidates = min(postings, key=len)
+            else:
+                candidates = range(len(self.paths))  # Only common short terms, matches come early
+
+            results = []
+            for count, path_id in enumerate(candidates):
+                if count % 4096 == 0 and cancelled is not None and cancelled.is_set():
+                    break
+                lowered = self.lowered[path_id]
+                if lowered is not None and all(match(lowered) for match in matchers):
+                    results.append(self.paths[path_id])
+                    if len(results) >= limit:
+                        break
+            return results
+
+    def _containing_locked(self, literal):
+        """Ids of the paths containing a literal too short to have trigrams of its own.
+
+        Every occurrence of such a literal lies inside one of the trigrams of its padded path,
+        so the ids are the union of the postings of the trigrams containing it.
+        Returns None when the literal is so common that scanning the paths in order, which
+        stops at the result limit, is cheaper than the union.
+        """
+        postings = [ids for trigram, ids in self.postings.items() if literal in trigram]
+        if sum(map(len, postings)) > len(self.paths):
+            return None
+        return sorted(set().union(*postings))
+
+    @staticmethod
+    def _glob_matcher(term):
+        regex = re.compile(fnmatch.translate(term))
+        if '/' in term:
+            return lambda p: regex.match(p) is not None
+        return lambda p: regex.match(p.rpartition('/')[2]) is not None
+
+
+class FileTreeView:
+    def __init__(self, parent, folder_path, heading='Files', on_selection_change=None, view_name=None):
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=10, pady=10)
+
+        self.base_folder = Path(folder_path)  # Store the base folder path
+        self.on_selection_change = on_selection_change  # Callback for selection change
+        self.view_name = view_name  # Identifier for the view
+
+        # Search box with a result list that jumps to the matching file in the tree
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(self.frame, textvariable=self.search_var)
+        self.search_entry.pack(side=tk.TOP, fill=tk.X)
+        self.search_entry.bind('<KeyRelease>', self.on_search_changed)
+        self.search_entry.bind('<Return>', self.jump_to_first_match)
+        self.search_entry.bind('<Escape>', self.clear_search)
+        self.results = tk.Listbox(self.frame, height=8)
+        self.results.bind('<Double-Button-1>', self.jump_to_selected_match)
+        self.results.bind('<Return>', self.jump_to_selected_match)
+        self._search_job = None
+        self._search = None  # Cancels the query running in the background when set
+
+        # Treeview for displaying files with custom heading
+        self.tree = ttk.Treeview(self.frame, selectmode='none')  # Disable extended selection
+        self.tree.pack(expand=True, fill=tk.BOTH)
+        self.tree.bind('<<TreeviewOpen>>', self.open_node)
+        self.tree.bind('<Button-1>', self.on_click)  # Bind click event for selection handling
+        self.selected_files = set()
+
+        # Scrollbars
+        ysb = ttk.Scrollbar(self.frame, orient='vertical', command=self.tree.yview)
+        xsb = ttk.Scrollbar(self.frame, orient='horizontal', command=self.tree.xview)
+        self.tree.configure(yscroll=ysb.set, xscroll=xsb.set)
+        ysb.pack(side='right', fill='y')
+        xsb.pack(side='bottom', fill='x')
+
+        # Initialize columns with custom heading
+        self.tree.heading('#0', text=heading, anchor='w')
+
+        # Load the folder
+        self.load_folder(self.base_folder)
+
+    def load_folder(self, folder_path: Path):
+        """Load the contents of the folder directly into the tree view, without showing the top-level folder."""
+        self.tree.delete(*self.tree.get_children())
+        self.populate_tree('', folder_path)
+
+        # Index the whole folder in the background for the search box
+        self.index = PathIndex(folder_path)
+        self.index.refresh_async()
+
+    def populate_tree(self, parent, folder_path: Path):
+        """Populate tree with files and folders, hiding hidden files and sorting alphabetically."""
+        items = sorted(folder_path.iterdir(), key=lambda p: p.name.lower())  # Sort alphabetically
+        for item in items:
+            if item.name.startswith('.'):
+                continue  # Skip hidden files
+            node_id = self.tree.insert(parent, 'end', text=item.name, open=False)
+            if item.is_dir():
+                self.tree.insert(node_id, 'end')  # Placeholder for folder
+            elif str(item) in self.selected_files:
+                self.tree.selection_add(node_id)  # Re-select previously selected files
+
+    def open_node(self, event):
+        """Open folder and populate its content when a node is expanded."""
+        self.expand_node(self.tree.focus())
+
+    def expand_node(self, node_id):
+        """Replace the placeholder child of a folder node with its actual content."""
+        full_path = self.get_full_path(node_id)
+
+        if full_path.is_dir():
+            # Clear placeholder children
+            if self.tree.get_children(node_id):
+                self.tree.delete(*self.tree.get_children(node_id))
+            # Populate the folder
+            self.populate_tree(node_id, full_path)
+
+            # The folder was just listed, so bring its part of the search index up to date
+            if self.index.ready.is_set():
+                relative_dir = full_path.relative_to(self.base_folder).as_posix()
+                threading.Thread(target=self.index.refresh, args=('' if relative_dir == '.' else relative_dir,),
+                                 daemon=True).start()
+
+    def on_click(self, event):
+        """Handle click event for selecting and deselecting files."""
+        item_id = self.tree.identify_row(event.y)
+        if item_id:
+            full_path = Path(self.get_full_path(item_id))
+            if full_path.is_dir():
+                # Folders can only be opened, not selected
+                return
+
+            if str(full_path) in self.selected_files:
+                self.selected_files.remove(str(full_path))
+                self.tree.selection_remove(item_id)
+            else:
+                self.selected_files.add(str(full_path))
+                self.tree.selection_add(item_id)
+
+            # Trigger the callback if provided, pass view name for identification
+            if self.on_selection_change:
+                self.on_selection_change(self.view_name, self.get_selected_files())
+
+    def on_search_changed(self, event):
+        """Coalesce keystrokes so only the latest query is run once the UI is idle."""
+        if self._search_job:
+            self.frame.after_cancel(self._search_job)
+        self._search_job = self.frame.after_idle(self.run_search)
+
+    def run_search(self):
+        """Look the search box up on a background thread, replacing any running query."""
+        self._search_job = None
+        if self._search:
+            self._search.set()
+            self._search = None
+        query = self.search_var.get()
+        if not query.strip():
+            self.results.delete(0, tk.END)
+            self.results.pack_forget()
+            return
+
+        # Queries whose terms are rare or short can still scan many paths; keep the UI free
+        cancelled = self._search = threading.Event()
+        found = []
+        worker = threading.Thread(target=lambda: found.append(self.index.search(query, cancelled=cancelled)),
+                                  daemon=True)
+        worker.start()
+        worker.join(0.01)  # Most queries take a few ms, show those with the keystroke
+        self.poll_search(cancelled, found)
+
+    def poll_search(self, cancelled, found):
+        """Show the results of the latest query once its worker is done."""
+        if cancelled.is_set():
+            return  # Replaced by a newer query
+        if not found:
+            self.frame.after(20, self.poll_search, cancelled, found)
+            return
+
+        self._search = None
+        matches = found[0]
+        self.results.delete(0, tk.END)
+        if not self.index.ready.is_set():
+            matches.append('… still indexing')
+        self.results.insert(tk.END, *matches)
+        self.results.pack(side=tk.TOP, fill=tk.X, before=self.tree)
+
+    def clear_search(self, event=None):
+        self.search_var.set('')
+        self.run_search()
+
+    def jump_to_first_match(self, event):
+        if self.results.size():
+            self.reveal(self.results.get(0))
+
+    def jump_to_selected_match(self, event):
+        selection = self.results.curselection()
+        if selection:
+            self.reveal(self.results.get(selection[0]))
+
+    def reveal(self, relative_path):
+        """Expand the folders leading to a path and scroll the tree to it."""
+        node_id = ''
+        for part in Path(relative_path).parts:
+            if self.tree.get_children(node_id) and not self.tree.item(self.tree.get_children(node_id)[0], 'text'):
+                self.expand_node(node_id)  # Folder still holds its placeholder
+            for child in self.tree.get_children(node_id):
+                if self.tree.item(child, 'text') == part:
+                    node_id = child
+                    break
+            else:
+                return  # Path no longer exists in the tree
+            self.tree.item(node_id, open=True)
+
+        self.tree.item(node_id, open=False)
+        self.tree.see(node_id)
+        self.tree.focus(node_id)
+
+    def get_full_path(self, node_id):
+        """Get full path of the selected node relative to the base folder."""
+        parts = []
+        while node_id:
+            node_text = self.tree.item(node_id, 'text')
+            parts.insert(0, node_text)
+            node_id = self.tree.parent(node_id)
+        return self.base_folder.joinpath(*parts)
+
+    def get_selected_files(self):
+        """Return the set of user-selected files."""
+        return list(self.selected_files)
+
+    def select_items(self, file_paths):
+        """Programmatically select specific files based on their paths."""
+        self.selected_files.clear()
+        self.tree.selection_remove(self.tree.selection())  # Clear previous selections
+
+        for file_path in file_paths:
+            # Get relative path to match nodes in the tree
+            relative_path = Path(file_path).relative_to(self.base_folder)
+
+            # Find and select the corresponding item in the tree
+            current_node = ''
+            for part in relative_path.parts:
+                for child in self.tree.get_children(current_node):
+                    if self.tree.item(child, 'text') == part:
+                        current_node = child
+                        break
+
+            # If a valid file was found, select it
+            if current_node:
+                self.selected_files.add(str(self.base_folder / relative_path))
+                self.tree.selection_add(current_node)
+
+
+# Main Application Window
+class Application(tk.Tk):
+    def __init__(self):
+        super().__init__()
+
+        self.title("File Browser Application")
+        self.geometry('800x600')
+
+        # Left panel with Listbox and Quit button
+        left_frame = ttk.Frame(self)
+        left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
+
+        self.listbox = tk.Listbox(left_frame)
+        self.listbox.pack(side=tk.TOP, fill=tk.Y, expand=True)
+
+        # Add ranges to the listbox
+        for i in range(1, 41):
+            self.listbox.insert(tk.END, f'Range {i}')
+
+        # Quit button
+        quit_button = ttk.Button(left_frame, text='Quit', command=self.quit)
+        quit_button.pack(side=tk.BOTTOM, fill=tk.X, pady=10)
+
+        # Right panel with FileTreeView frames
+        right_frame = ttk.Frame(self)
+        right_frame.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+
+        # File view 1 (Link Files with custom heading)
+        self.link_files_view = FileTreeView(right_frame, '/Users/mikekriege/EMC/Factors', heading='Link Files',
+                                            on_selection_change=self.on_file_selection_change, view_name='Link Files')
+
+        # File view 2 (Limits with custom heading)
+        self.limits_view = FileTreeView(right_frame, '/Users/mikekriege/EMC/Limits', heading='Limits',
+                                        on_selection_change=self.on_file_selection_change, view_name='Limits')
+
+    @staticmethod
+    def on_file_selection_change(view_name, selected_files):
+        """Handle file selection changes in FileTreeView."""
+        print(f"Selected files updated in {view_name}: {selected_files}")
+        # You can update your application state or save the selected files to a file
+
+
+# Run the application
+if __name__ == '__main__':
+    app = Application()
+    app.mainloop()
@@ -0,0 +1,1150 @@
+import fnmatch
+import os
+import queue
+import re
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
+from array import array
+from tkinter import ttk
+from pathlib import Path
+from typing import NamedTuple
+
+
+class PathIndex:
+    """Trigram index over every (non-hidden) path below a root folder.
+
+    Paths are stored once, relative to the root, and every lower-cased path is broken into
+    trigrams. Each trigram maps to a compact array of path ids, so a query only has to look
+    at the paths sharing its rarest trigram instead of scanning the whole tree. Paths are
+    indexed as ``/path\n`` plus the first two letters of the file name after a NUL, so
+    globs, which are anchored, have trigrams like ``\0ka`` or ``txt\n`` even when their
+    literal parts are short.
+
+    The index is built by a background thread and refreshed incrementally: directories whose
+    modification time has not changed since the last walk are not listed again.
+    """
+
+    GLOB_CHARS = re.compile(r'[*?\[]')
+    GLOB_WILDCARDS = re.compile(r'\[[^\]]*\]|[*?]')
+    COMPACT_RATIO = 0.25  # Rebuild the postings once a quarter of the paths are stale
+
+    def __init__(self, root_path):
+        self.root_path = Path(root_path)
+        self.lock = threading.Lock()
+        self.paths = []  # Relative path of each id, None once removed
+        self.lowered = []  # Lower-cased copy used for matching
+        self.postings = {}  # trigram -> array of path ids
+        self.path_ids = {}  # relative path -> id
+        self.listings = {}  # relative dir -> (mtime_ns, names of its children) at the last listing
+        self.removed = 0
+        self.ready = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._worker = None
+
+    def __len__(self):
+        return len(self.path_ids)
+
+    def refresh_async(self, on_done=None):
+        """Walk the root folder on a background thread, only listing changed directories."""
+        if self._worker and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._refresh, args=(on_done,), daemon=True)
+        self._worker.start()
+
+    def _refresh(self, on_done):
+        self.refresh()
+        self.ready.set()
+        if on_done:
+            on_done()
+
+    def refresh(self, relative_dir=''):
+        """Synchronously bring the index up to date for a folder and everything below it."""
+        with self._refresh_lock:
+            pending = [relative_dir]
+            while pending:
+                rel_dir = pending.pop()
+                prefix = rel_dir + '/' if rel_dir else ''
+                try:
+                    mtime = (self.root_path / rel_dir).stat().st_mtime_ns
+                except OSError:
+                    self._replace_children(rel_dir, {}, None)
+                    continue
+
+                listing = self.listings.get(rel_dir)
+                if listing and listing[0] == mtime:
+                    # Listing unchanged; only the already known sub folders need a look
+                    pending.extend(prefix + name for name, is_dir in listing[1].items() if is_dir)
+                    continue
+
+                children = {}
+                try:
+                    for entry in os.scandir(self.root_path / rel_dir):
+                        if entry.name.startswith('.'):
+                            continue  # Skip hidden files
+                        try:
+                            children[entry.name] = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            children[entry.name] = False
+                except OSError:
+                    continue  # Skip folders that cannot be accessed
+
+                self._replace_children(rel_dir, children, mtime)
+                pending.extend(prefix + name for name, is_dir in children.items() if is_dir)
+
+    def _replace_children(self, rel_dir, children, mtime):
+        """Swap the indexed direct children of a folder for a fresh listing."""
+        prefix = rel_dir + '/' if rel_dir else ''
+        with self.lock:
+            known = self.listings.pop(rel_dir, (None, {}))[1]
+            for name in known.keys() - children.keys():
+                self._remove_locked(prefix + name)
+                if known[name]:
+                    self._forget_dir_locked(prefix + name)
+            for name in sorted(children.keys() - known.keys()):
+                self._add_locked(prefix + name)
+            if mtime is not None:
+                self.listings[rel_dir] = (mtime, children)
+            self._maybe_compact_locked()
+
+    def _forget_dir_locked(self, rel_dir):
+        """Forget a removed folder and everything that was indexed below it."""
+        known = self.listings.pop(rel_dir, (None, {}))[1]
+        for name, is_dir in known.items():
+            self._remove_locked(f'{rel_dir}/{name}')
+            if is_dir:
+                self._forget_dir_locked(f'{rel_dir}/{name}')
+
+    def _add_locked(self, rel_path):
+        path_id = len(self.paths)
+        lowered = rel_path.lower()
+        self.paths.append(rel_path)
+        self.lowered.append(lowered)
+        self.path_ids[rel_path] = path_id
+        name = lowered.rpartition('/')[2]
+        for trigram in self.trigrams(f'/{lowered}\n') | {f'\0{name}\n'[:3]}:
+            try:
+                self.postings[trigram].append(path_id)
+            except KeyError:
+                self.postings[trigram] = array('I', (path_id,))
+
+    def _remove_locked(self, rel_path):
+        path_id = self.path_ids.pop(rel_path, None)
+        if path_id is not None:
+            self.paths[path_id] = None
+            self.lowered[path_id] = None
+            self.removed += 1
+
+    def _maybe_compact_locked(self):
+        """Drop stale ids once enough paths have been removed."""
+        if self.removed <= len(self.paths) * self.COMPACT_RATIO:
+            return
+        live = sorted(self.path_ids)
+        self.paths, self.lowered, self.postings, self.path_ids = [], [], {}, {}
+        self.removed = 0
+        for rel_path in live:
+            self._add_locked(rel_path)
+
+    @staticmethod
+    def trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def search(self, query, limit=200, cancelled=None):
+        """Return up to ``limit`` relative paths matching the query.
+
+        Whitespace separated terms must all appear in the path, in any order. A term
+        containing ``*``, ``?`` or ``[`` is a glob matched against the file name, or against
+        the whole relative path when it contains a ``/``. Setting the ``cancelled`` event
+        stops the search early; whatever was found so far is returned.
+        """
+        terms = query.lower().split()
+        if not terms:
+            return []
+
+        matchers = []
+        literals = []
+        for term in terms:
+            if self.GLOB_CHARS.search(term):
+                matchers.append(self._glob_matcher(term))
+                parts = self.GLOB_WILDCARDS.split(term)
+                # Globs match a whole name or path, so their ends are anchored
+                start = '/' if '/' in term else '\0'
+                parts[0] = start + parts[0] if parts[0] else ''
+                parts[-1] = parts[-1] + '\n' if parts[-1] else ''
+                literals.extend(part for part in parts if part)
+            else:
+                matchers.append(lambda p, t=term: t in p)
+                literals.append(term)
+        trigrams = set().union(*map(self.trigrams, literals))
+        short = {literal for literal in literals if len(literal) < 3}
+
+        with self.lock:
+            postings = [self.postings.get(t) for t in trigrams]
+            if any(p is None for p in postings):
+                return []  # A required trigram never occurs
+            for literal in short:
+                ids = self._containing_locked(literal)
+                if ids is not None:
+                    postings.append(ids)
+            if postings:
+                candidates = min(postings, key=len)
+            else:
+                candidates = range(len(self.paths))  # Only common short terms, matches come early
+
+            results = []
+            for count, path_id in enumerate(candidates):
+                if count % 4096 == 0 and cancelled is not None and cancelled.is_set():
+                    break
+                lowered = self.lowered[path_id]
+                if lowered is not None and all(match(lowered) for match in matchers):
+                    results.append(self.paths[path_id])
+                    if len(results) >= limit:
+                        break
+            return results
+
+    def _containing_locked(self, literal):
+        """Ids of the paths containing a literal too short to have trigrams of its own.
+
+        Every occurrence of such a literal lies inside one of the trigrams of its padded path,
+        so the ids are the union of the postings of the trigrams containing it.
+        Returns None when the literal is so common that scanning the paths in order, which
+        stops at the result limit, is cheaper than the union.
+        """
+        postings = [ids for trigram, ids in self.postings.items() if literal in trigram]
+        if sum(map(len, postings)) > len(self.paths):
+            return None
+        return sorted(set().union(*postings))
+
+    @staticmethod
+    def _glob_matcher(term):
+        regex = re.compile(fnmatch.translate(term))
+        if '/' in term:
+            return lambda p: regex.match(p) is not None
+        return lambda p: regex.match(p.rpartition('/')[2]) is not None
+
+
+class _FolderNode:
+    __slots__ = ('mark', 'count', 'folders', 'flipped')
+
+    def __init__(self, mark=None):
+        self.mark = mark  # True/False selects/deselects the whole folder, None inherits from the parent
+        self.count = 0  # Selected files below this folder, minus the deselected ones inside a selected parent
+        self.folders = None  # name -> _FolderNode for sub folders holding marks
+        self.flipped = None  # Names (dict keys) of the files whose state differs from the folder's
+
+
+class SelectionTrie:
+    """Set of selected file paths stored as a trie of folders.
+
+    Paths share their common folders, so selecting thousands of files in one campaign
+    folder stores each folder once and each file only by name. Whole folders can be
+    selected or deselected with a single mark on the folder node; files and folders below
+    it inherit the mark, and only the exceptions to it are kept. Nodes that no longer hold
+    any exception are pruned.
+
+    Per folder counts are kept up to date on every change, which needs the number of files
+    below a folder when it is marked as a whole (see ``add_folder``).
+    """
+
+    def __init__(self, paths=()):
+        self.root = _FolderNode(mark=False)
+        for path in paths:
+            self.add(path)
+
+    @staticmethod
+    def _parts(path):
+        return Path(path).parts
+
+    def _walk(self, parts):
+        """Return the deepest existing folder on the way to ``parts``, its depth and state."""
+        node, depth, state = self.root, 0, self.root.mark
+        for part in parts:
+            child = node.folders.get(part) if node.folders else None
+            if child is None:
+                break
+            node, depth = child, depth + 1
+            if child.mark is not None:
+                state = child.mark
+        return node, depth, state
+
+    def _path_to(self, parts):
+        """Return the folders from the root down to ``parts``, creating missing ones.
+
+        Also returns the state the last folder inherits from its parents.
+        """
+        nodes = [self.root]
+        state = self.root.mark
+        for part in parts:
+            node = nodes[-1]
+            if node.mark is not None:
+                state = node.mark
+            if node.folders is None:
+                node.folders = {}
+            child = node.folders.get(part)
+            if child is None:
+                child = node.folders[part] = _FolderNode()
+            nodes.append(child)
+        return nodes, state
+
+    @staticmethod
+    def _update_counts(nodes, delta):
+        if delta:
+            for node in nodes:
+                node.count += delta
+
+    @staticmethod
+    def _prune(nodes, parts, inherited):
+        """Remove trailing folders that no longer hold any exception."""
+        for depth in range(len(nodes) - 1, 0, -1):
+            node = nodes[depth]
+            if node.folders or node.flipped or node.mark not in (None, inherited):
+                break
+            del nodes[depth - 1].folders[parts[depth - 1]]
+            if not nodes[depth - 1].folders:
+                nodes[depth - 1].folders = None
+            inherited = None  # Ancestors are only pruned while they carry no mark
+
+    def __contains__(self, path):
+        *folder, name = self._parts(path)
+        node, depth, state = self._walk(folder)
+        if depth == len(folder) and node.flipped and name in node.flipped:
+            return not state
+        return state
+
+    def __len__(self):
+        return self.root.count
+
+    def __bool__(self):
+        return self.root.count > 0
+
+    def add(self, path):
+        """Select a single file."""
+        self._set_file(self._parts(path), True)
+
+    def discard(self, path):
+        """Deselect a single file, including one inside a selected folder."""
+        self._set_file(self._parts(path), False)
+
+    def remove(self, path):
+        if path not in self:
+            raise KeyError(path)
+        self.discard(path)
+
+    def _set_file(self, parts, selected):
+        *folder_parts, name = parts
+        nodes, inherited = self._path_to(folder_parts)
+        folder = nodes[-1]
+        state = inherited if folder.mark is None else folder.mark
+        if folder.flipped is None:
+            folder.flipped = {}
+
+        if (state != selected) == (name in folder.flipped):
+            self._prune(nodes, folder_parts, inherited)
+            return  # Already in the requested state
+
+        if state != selected:
+            folder.flipped[name] = None
+        else:
+            del folder.flipped[name]
+        if not folder.flipped:
+            folder.flipped = None
+        self._update_counts(nodes, 1 if selected else -1)
+        self._prune(nodes, folder_parts, inherited)
+
+    def add_folder(self, path, file_count=0):
+        """Select everything below a folder with one mark.
+
+        ``file_count`` is the number of files below the folder and is only used to keep
+        ``count`` exact; marking itself does not look at the disk.
+        """
+        self._set_folder(self._parts(path), True, file_count)
+
+    def discard_folder(self, path, file_count=0):
+        """Deselect everything below a folder with one mark."""
+        self._set_folder(self._parts(path), False, file_count)
+
+    def _set_folder(self, parts, selected, file_count):
+        nodes, inherited = self._path_to(parts)
+        folder = nodes[-1]
+        if folder.mark is None and inherited:
+            # Counts below a selected folder only track the files deselected from it
+            previous = file_count + folder.count
+        else:
+            previous = folder.count
+        folder.mark = selected
+        folder.folders = None  # Every exception below is overridden by the new mark
+        folder.flipped = None
+        folder.count = previous
+        self._update_counts(nodes, (file_count if selected else 0) - previous)
+        self._prune(nodes, parts, inherited)
+
+    def folder_state(self, folder):
+        """True if everything below a folder is selected, False if nothing is, None if part is."""
+        parts = self._parts(folder)
+        node, depth, state = self._walk(parts)
+        if depth == len(parts) and (node.folders or node.flipped):
+            return None  # Exceptions below it; nodes without any are pruned
+        return state
+
+    def count(self, folder=''):
+        """Number of selected files below a folder, or None if it is inside a folder mark."""
+        parts = self._parts(folder)
+        node, depth, state = self._walk(parts)
+        if not state:
+            return node.count if depth == len(parts) else 0
+        if depth == len(parts) and node.mark:
+            return node.count
+        return None
+
+    def clear(self):
+        self.root = _FolderNode(mark=False)
+
+    def marks(self):
+        """Yield ``(path, selected)`` for every folder mark and file exception, parents first."""
+        stack = [((), self.root, False)]
+        while stack:
+            parts, node, state = stack.pop()
+            if node.mark is not None:
+                state = node.mark
+                if parts:
+                    yield Path(*parts), state
+            for name in node.flipped or ():
+                yield Path(*parts, name), not state
+            for name, child in (node.folders or {}).items():
+                stack.append((parts + (name,), child, state))
+
+    def __iter__(self):
+        """Yield every selected file as a string, listing marked folders from disk."""
+        stack = [((), self.root)]
+        while stack:
+            parts, node = stack.pop()
+            if node.mark:
+                if parts:
+                    yield from self._iter_folder(Path(*parts))
+                continue
+            for name in node.flipped or ():
+                yield str(Path(*parts, name))
+            for name, child in (node.folders or {}).items():
+                stack.append((parts + (name,), child))
+
+    def _iter_folder(self, folder):
+        """List the non-hidden files of a selected folder, honouring the exceptions below it."""
+        for dirpath, dirnames, filenames in os.walk(folder):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            for name in filenames:
+                if not name.startswith('.'):
+                    path = os.path.join(dirpath, name)
+                    if path in self:
+                        yield path
+
+
+class FolderEnumerator:
+    """Count the (non-hidden) files below a folder on a pool of worker threads.
+
+    Every directory listing is a separate job, so wide trees on network shares are listed
+    in parallel. Progress is exposed through ``file_count``/``dir_count`` and the ``done``
+    event; nothing here touches Tk, the caller polls from the main loop.
+    """
+
+    def __init__(self, folder, workers=8):
+        self.folder = Path(folder)
+        self.file_count = 0
+        self.dir_count = 0
+        self.done = threading.Event()
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='enumerate')
+
+    def start(self):
+        self._submit(self.folder)
+        return self
+
+    def cancel(self):
+        """Stop listing; jobs already running finish their directory and are ignored."""
+        self.cancelled = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.done.set()
+
+    def _submit(self, folder):
+        with self._lock:
+            self._pending += 1
+        try:
+            self._executor.submit(self._list, folder)
+        except RuntimeError:
+            pass  # Executor already shut down by cancel()
+
+    def _list(self, folder):
+        files, folders = 0, []
+        if not self.cancelled:
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue  # Skip hidden files
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                folders.append(entry.path)
+                            else:
+                                files += 1
+                        except OSError:
+                            pass
+            except OSError:
+                pass  # Skip folders that cannot be accessed
+
+        for sub_folder in folders:
+            self._submit(sub_folder)
+        with self._lock:
+            self.file_count += files
+            self.dir_count += 1
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished and not self.cancelled:
+            self._executor.shutdown(wait=False)
+            self.done.set()
+
+
+class SelectionChange(NamedTuple):
+    """Paths added to and removed from a selection since the previous notification.
+
+    A path is a file, or a folder when the whole folder was (de)selected at once. When
+    ``reset`` is set the selection was replaced as a whole: ``added`` holds all of it and
+    state built from earlier changes has to be dropped first.
+    """
+    added: tuple
+    removed: tuple
+    reset: bool = False
+
+
+class SelectionNotifier:
+    """Collect selection changes and report them as one delta per quiet period.
+
+    Every change restarts a short timer; when it expires the callback receives the net
+    change, so a path toggled twice within the window is not reported at all.
+    """
+
+    def __init__(self, widget, callback, delay_ms=150):
+        self.widget = widget
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._original = {}  # path -> state before the first pending change, None if partial
+        self._current = {}  # path -> latest selected state
+        self._job = None
+
+    def changed(self, path, selected, was_selected):
+        """Record that ``path`` went from ``was_selected`` to ``selected`` and schedule a notification.
+
+        ``was_selected`` is None for a folder that was partly selected.
+        """
+        path = str(path)
+        self._original.setdefault(path, was_selected)
+        self._current[path] = selected
+        if self._job:
+            self.widget.after_cancel(self._job)
+        self._job = self.widget.after(self.delay_ms, self.flush)
+
+    def flush(self):
+        """Send the pending net change right away."""
+        if self._job:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+        added, removed = [], []
+        for path, selected in self._current.items():
+            if selected != self._original[path]:
+                (added if selected else removed).append(path)
+        self._original.clear()
+        self._current.clear()
+
+        if added or removed:
+            self.callback(SelectionChange(tuple(added), tuple(removed)))
+
+    def reset(self, paths):
+        """Report right away that the selection was replaced by ``paths``.
+
+        Pending changes are dropped, the new selection supersedes them.
+        """
+        if self._job:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self._original.clear()
+        self._current.clear()
+        self.callback(SelectionChange(tuple(str(path) for path in paths), (), reset=True))
+
+
+class MetadataWorker:
+    """Background thread that stats tree rows and sorts folders by their metadata.
+
+    Results are cached per directory and thrown away when the directory's modification
+    time changes, so scrolling back over rows that were already shown costs nothing. The
+    worker never touches Tk; the view drains ``results`` from the main loop.
+    """
+
+    COLUMNS = {'size': 'Size', 'mtime': 'Modified', 'type': 'Type'}
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.cache = {}  # directory -> (mtime_ns, {name: (size, mtime, type)})
+        self._checked = set()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def request_stats(self, rows):
+        """Queue ``(item_id, path)`` rows to be stat'ed."""
+        self.jobs.put(('stats', rows, None))
+
+    def request_sort(self, folders, column, reverse):
+        """Queue ``{parent_id: (folder, [(item_id, name), ...])}`` to be ordered by a column."""
+        self.jobs.put(('sort', folders, (column, reverse)))
+
+    def _run(self):
+        while True:
+            kind, payload, options = self.jobs.get()
+            self._checked = set()  # Directories validated against the disk during this job
+            if kind == 'stats':
+                self.results.put(('stats', [(item_id, self.metadata(path)) for item_id, path in payload]))
+            else:
+                column, reverse = options
+                index = list(self.COLUMNS).index(column)
+                orders = {}
+                for parent_id, (folder, rows) in payload.items():
+                    keyed = [(self.metadata(folder / name), name.lower(), item_id) for item_id, name in rows]
+                    keyed.sort(key=lambda row: (row[0][index], row[1]), reverse=reverse)
+                    orders[parent_id] = [item_id for _, _, item_id in keyed]
+                self.results.put(('sort', orders))
+
+    def metadata(self, path):
+        """Return ``(size, mtime, type)`` of a path from the cache, stat'ing it on a miss."""
+        directory = str(path.parent)
+        cached_mtime, entries = self.cache.get(directory, (None, None))
+        if directory not in self._checked:
+            self._checked.add(directory)
+            try:
+                dir_mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                dir_mtime = None
+            if entries is None or cached_mtime != dir_mtime:
+                entries = {}
+                self.cache[directory] = (dir_mtime, entries)
+
+        try:
+            return entries[path.name]
+        except KeyError:
+            pass
+        try:
+            st = path.stat()
+            is_dir = stat.S_ISDIR(st.st_mode)
+            values = (0 if is_dir else st.st_size, st.st_mtime, 'Folder' if is_dir else (path.suffix[1:].upper() or 'File'))
+        except OSError:
+            values = (-1, 0.0, '')
+        entries[path.name] = values
+        return values
+
+    @staticmethod
+    def format(values):
+        size, mtime, kind = values
+        if kind == 'Folder' or size < 0:
+            size_text = ''
+        elif size < 1024:
+            size_text = f'{size} B'
+        elif size < 1024 ** 2:
+            size_text = f'{size / 1024:.1f} KB'
+        else:
+            size_text = f'{size / 1024 ** 2:.1f} MB'
+        mtime_text = time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime)) if mtime else ''
+        return size_text, mtime_text, kind
+
+
+class FileTreeView:
+    def __init__(self, parent, folder_path, heading='Files', on_selection_change=None, view_name=None,
+                 show_metadata=False):
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=10, pady=10)
+
+        self.base_folder = Path(folder_path)  # Store the base folder path
+        self.on_selection_change = on_selection_change  # Callback for selection change deltas
+        self.view_name = view_name  # Identifier for the view
+
+        # Search box with a result list that jumps to the matching file in the tree
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(self.frame, textvariable=self.search_var)
+        self.search_entry.pack(side=tk.TOP, fill=tk.X)
+        self.search_entry.bind('<KeyRelease>', self.on_search_changed)
+        self.search_entry.bind('<Return>', self.jump_to_first_match)
+        self.search_entry.bind('<Escape>', self.clear_search)
+        self.results = tk.Listbox(self.frame, height=8)
+        self.results.bind('<Double-Button-1>', self.jump_to_selected_match)
+        self.results.bind('<Return>', self.jump_to_selected_match)
+        self._search_job = None
+        self._search = None  # Cancels the query running in the background when set
+
+        # Treeview for displaying files with custom heading
+        self.tree = ttk.Treeview(self.frame, selectmode='none')  # Disable extended selection
+        self.tree.pack(expand=True, fill=tk.BOTH)
+        self.tree.bind('<<TreeviewOpen>>', self.open_node)
+        self.tree.bind('<Button-1>', self.on_click)  # Bind click event for selection handling
+        self.notifier = SelectionNotifier(self.frame, self.notify_selection_change)
+        self.tree.bind('<Button-3>', self.on_context_menu)
+        self.tree.bind('<Escape>', self.cancel_folder_selection)
+        self.selected_files = SelectionTrie()
+
+        # Context menu and progress line for selecting whole folders
+        self.folder_menu = tk.Menu(self.tree, tearoff=False)
+        self.status = ttk.Label(self.frame, anchor='w')
+        self._enumerator = None
+        self._enumerated_node = None
+        self._enumerated_select = True
+
+        # Scrollbars
+        ysb = ttk.Scrollbar(self.frame, orient='vertical', command=self.tree.yview)
+        xsb = ttk.Scrollbar(self.frame, orient='horizontal', command=self.tree.xview)
+        self.tree.configure(yscroll=ysb.set, xscroll=xsb.set)
+        ysb.pack(side='right', fill='y')
+        xsb.pack(side='bottom', fill='x')
+
+        # Initialize columns with custom heading
+        self.tree.heading('#0', text=heading, anchor='w',
+                          command=lambda: self.sort_by('name') if show_metadata else None)
+
+        # Optional size/modified/type columns, filled in for visible rows only
+        self.metadata = MetadataWorker() if show_metadata else None
+        self._metadata_requested = set()  # Items whose metadata is stat'ed or on its way
+        self._names = {}  # item id -> file name, so sorting needs no Tk call per row
+        self._visible_job = None
+        self.sort_column, self.sort_reverse = 'name', False
+        if self.metadata:
+            self.tree['columns'] = tuple(MetadataWorker.COLUMNS)
+            for column, title in MetadataWorker.COLUMNS.items():
+                self.tree.column(column, width=90, stretch=False, anchor='e' if column == 'size' else 'w')
+                self.tree.heading(column, text=title, command=lambda c=column: self.sort_by(c))
+            self.tree.configure(yscroll=self.on_tree_scrolled(ysb))
+            self.tree.bind('<Configure>', self.schedule_visible_metadata, add=True)
+            self.frame.after(50, self.poll_metadata)
+
+        # Load the folder
+        self.load_folder(self.base_folder)
+
+    def load_folder(self, folder_path: Path):
+        """Load the contents of the folder directly into the tree view, without showing the top-level folder."""
+        self.tree.delete(*self.tree.get_children())
+        self._names.clear()
+        self.populate_tree('', folder_path)
+
+        # Index the whole folder in the background for the search box
+        self.index = PathIndex(folder_path)
+        self.index.refresh_async()
+
+    def populate_tree(self, parent, folder_path: Path):
+        """Populate tree with files and folders, hiding hidden files and sorting alphabetically."""
+        items = sorted(folder_path.iterdir(), key=lambda p: p.name.lower())  # Sort alphabetically
+        for item in items:
+            if item.name.startswith('.'):
+                continue  # Skip hidden files
+            node_id = self.tree.insert(parent, 'end', text=item.name, open=False)
+            self._names[node_id] = item.name
+            if item.is_dir():
+                self.tree.insert(node_id, 'end')  # Placeholder for folder
+            elif item in self.selected_files:
+                self.tree.selection_add(node_id)  # Re-select previously selected files
+
+        if self.metadata and self.sort_column != 'name':
+            self.request_sort([parent])
+
+    def open_node(self, event):
+        """Open folder and populate its content when a node is expanded."""
+        self.expand_node(self.tree.focus())
+
+    def expand_node(self, node_id):
+        """Replace the placeholder child of a folder node with its actual content."""
+        full_path = self.get_full_path(node_id)
+
+        if full_path.is_dir():
+            # Clear placeholder children
+            if self.tree.get_children(node_id):
+                for child in self.tree.get_children(node_id):
+                    self._names.pop(child, None)  # Ids of rows further down are never reused
+                self.tree.delete(*self.tree.get_children(node_id))
+            # Populate the folder
+            self.populate_tree(node_id, full_path)
+            if self.metadata:
+                self.schedule_visible_metadata()
+
+            # The folder was just listed, so bring its part of the search index up to date
+            if self.index.ready.is_set():
+                relative_dir = full_path.relative_to(self.base_folder).as_posix()
+                threading.Thread(target=self.index.refresh, args=('' if relative_dir == '.' else relative_dir,),
+                                 daemon=True).start()
+
+    def on_tree_scrolled(self, scrollbar):
+        """Wrap the scrollbar update so scrolling also asks for the newly visible metadata."""
+        def yscroll(first, last):
+            scrollbar.set(first, last)
+            self.schedule_visible_metadata()
+        return yscroll
+
+    def schedule_visible_metadata(self, event=None):
+        if self._visible_job is None:
+            self._visible_job = self.frame.after_idle(self.request_visible_metadata)
+
+    def visible_items(self):
+        """Return the rows currently shown in the viewport, top to bottom."""
+        item_id = self.tree.identify_row(1)
+        height = self.tree.winfo_height()
+        items = []
+        while item_id:
+            bbox = self.tree.bbox(item_id)
+            if not bbox or bbox[1] > height:
+                break
+            items.append(item_id)
+            item_id = self.next_visible(item_id)
+        return items
+
+    def next_visible(self, item_id):
+        """Return the row displayed below ``item_id``, following open folders."""
+        children = self.tree.get_children(item_id)
+        if children and self.tree.item(item_id, 'open'):
+            return children[0]
+        while item_id:
+            next_id = self.tree.next(item_id)
+            if next_id:
+                return next_id
+            item_id = self.tree.parent(item_id)
+        return ''
+
+    def request_visible_metadata(self):
+        """Hand the visible rows without metadata to the worker."""
+        self._visible_job = None
+        rows = []
+        for item_id in self.visible_items():
+            if item_id not in self._metadata_requested and self.tree.item(item_id, 'text'):
+                self._metadata_requested.add(item_id)
+                rows.append((item_id, self.get_full_path(item_id)))
+        if rows:
+            self.metadata.request_stats(rows)
+
+    def sort_by(self, column):
+        """Order every loaded folder by a column; clicking the same heading again reverses it."""
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column, self.sort_reverse = column, False
+
+        arrow = ' \u25bc' if self.sort_reverse else ' \u25b2'
+        for name, title in (('#0', self.tree.heading('#0', 'text').rstrip(' \u25b2\u25bc')),
+                            *MetadataWorker.COLUMNS.items()):
+            selected = name == column or (name == '#0' and column == 'name')
+            self.tree.heading(name, text=title + (arrow if selected else ''))
+
+        folders = ['']
+        stack = ['']
+        while stack:
+            for child in self.tree.get_children(stack.pop()):
+                if self.tree.get_children(child) and self.tree.item(self.tree.get_children(child)[0], 'text'):
+                    folders.append(child)
+                    stack.append(child)
+        self.request_sort(folders)
+
+    def request_sort(self, parents):
+        """Ask the worker for the new order of the children of ``parents``."""
+        folders = {}
+        for parent in parents:
+            # Only the folder's path is built from the tree, rows are named from _names
+            rows = [(item_id, self._names[item_id]) for item_id in self.tree.get_children(parent)]
+            folders[parent] = (self.get_full_path(parent), rows)
+        if self.sort_column == 'name':
+            # Name order needs no stat; sort here like populate_tree does
+            for parent, (_, rows) in folders.items():
+                rows.sort(key=lambda row: row[1].lower(), reverse=self.sort_reverse)
+                self.tree.set_children(parent, *(item_id for item_id, _ in rows))
+            self.schedule_visible_metadata()
+        else:
+            self.metadata.request_sort(folders, self.sort_column, self.sort_reverse)
+
+    def poll_metadata(self):
+        """Apply finished stat and sort jobs without blocking on the worker."""
+        try:
+            while True:
+                result = self.metadata.results.get_nowait()
+                if result[0] == 'stats':
+                    for item_id, values in result[1]:
+                        if self.tree.exists(item_id):
+                            self.tree.item(item_id, values=MetadataWorker.format(values))
+                else:
+                    for parent_id, order in result[1].items():
+                        if parent_id and not self.tree.exists(parent_id):
+                            continue
+                        # A folder reopened since the sort was asked for has new rows; its
+                        # stale order would detach them, and populating sorts it again
+                        if set(order) == set(self.tree.get_children(parent_id)):
+                            self.tree.set_children(parent_id, *order)
+                    self.schedule_visible_metadata()
+        except queue.Empty:
+            pass
+        self.frame.after(50, self.poll_metadata)
+
+    def on_click(self, event):
+        """Handle click event for selecting and deselecting files."""
+        item_id = self.tree.identify_row(event.y)
+        if item_id:
+            full_path = Path(self.get_full_path(item_id))
+            if full_path.is_dir():
+                # Folders can only be opened, not selected
+                return
+
+            if full_path in self.selected_files:
+                self.selected_files.discard(full_path)
+                self.tree.selection_remove(item_id)
+                self.notifier.changed(full_path, False, True)
+            else:
+                self.selected_files.add(full_path)
+                self.tree.selection_add(item_id)
+                self.notifier.changed(full_path, True, False)
+
+    def on_context_menu(self, event):
+        """Offer selecting or deselecting everything below the folder under the pointer."""
+        item_id = self.tree.identify_row(event.y)
+        if not item_id or not self.get_full_path(item_id).is_dir():
+            return
+
+        self.folder_menu.delete(0, tk.END)
+        self.folder_menu.add_command(label='Select All in Folder',
+                                     command=lambda: self.select_folder(item_id, True))
+        self.folder_menu.add_command(label='Deselect All in Folder',
+                                     command=lambda: self.select_folder(item_id, False))
+        if self._enumerator:
+            self.folder_menu.add_separator()
+            self.folder_menu.add_command(label='Cancel Folder Selection', command=self.cancel_folder_selection)
+        self.folder_menu.tk_popup(event.x_root, event.y_root)
+
+    def select_folder(self, node_id, selected=True):
+        """Select or deselect every file below a folder, counting them in the background."""
+        self.cancel_folder_selection()
+        self._enumerated_node = node_id
+        self._enumerated_select = selected
+        self._enumerator = FolderEnumerator(self.get_full_path(node_id)).start()
+        self.status.pack(side=tk.BOTTOM, fill=tk.X, before=self.tree)
+        self.poll_folder_selection()
+
+    def poll_folder_selection(self):
+        """Report enumeration progress and apply the folder mark once it is complete."""
+        enumerator = self._enumerator
+        if enumerator is None:
+            return
+
+        if not enumerator.done.is_set():
+            self.status.config(text=f'Scanning {enumerator.folder.name}: {enumerator.file_count} files '
+                                    f'in {enumerator.dir_count} folders (Esc to cancel)')
+            self.frame.after(100, self.poll_folder_selection)
+            return
+
+        self._enumerator = None
+        self.status.pack_forget()
+        if enumerator.cancelled:
+            return
+
+        was_selected = self.selected_files.folder_state(enumerator.folder)
+        if self._enumerated_select:
+            self.selected_files.add_folder(enumerator.folder, enumerator.file_count)
+        else:
+            self.selected_files.discard_folder(enumerator.folder, enumerator.file_count)
+        self.refresh_selection(self._enumerated_node)
+
+        # One notification for the whole folder instead of one per file
+        self.notifier.changed(enumerator.folder, self._enumerated_select, was_selected)
+
+    def cancel_folder_selection(self, event=None):
+        """Abort a running folder selection, leaving the selection unchanged."""
+        if self._enumerator:
+            self._enumerator.cancel()
+            self._enumerator = None
+            self.status.pack_forget()
+
+    def refresh_selection(self, node_id=''):
+        """Sync the highlighted rows below a node with the selection model."""
+        stack = list(self.tree.get_children(node_id))
+        while stack:
+            child = stack.pop()
+            children = self.tree.get_children(child)
+            if children:
+                stack.extend(children)
+            elif self.tree.item(child, 'text'):
+                full_path = self.get_full_path(child)
+                if full_path in self.selected_files and not full_path.is_dir():
+                    self.tree.selection_add(child)
+                else:
+                    self.tree.selection_remove(child)
+
+    def on_search_changed(self, event):
+        """Coalesce keystrokes so only the latest query is run once the UI is idle."""
+        if self._search_job:
+            self.frame.after_cancel(self._search_job)
+        self._search_job = self.frame.after_idle(self.run_search)
+
+    def run_search(self):
+        """Look the search box up on a background thread, replacing any running query."""
+        self._search_job = None
+        if self._search:
+            self._search.set()
+            self._search = None
+        query = self.search_var.get()
+        if not query.strip():
+            self.results.delete(0, tk.END)
+            self.results.pack_forget()
+            return
+
+        # Queries whose terms are rare or short can still scan many paths; keep the UI free
+        cancelled = self._search = threading.Event()
+        found = []
+        worker = threading.Thread(target=lambda: found.append(self.index.search(query, cancelled=cancelled)),
+                                  daemon=True)
+        worker.start()
+        worker.join(0.01)  # Most queries take a few ms, show those with the keystroke
+        self.poll_search(cancelled, found)
+
+    def poll_search(self, cancelled, found):
+        """Show the results of the latest query once its worker is done."""
+        if cancelled.is_set():
+            return  # Replaced by a newer query
+        if not found:
+            self.frame.after(20, self.poll_search, cancelled, found)
+            return
+
+        self._search = None
+        matches = found[0]
+        self.results.delete(0, tk.END)
+        if not self.index.ready.is_set():
+            matches.append('… still indexing')
+        self.results.insert(tk.END, *matches)
+        self.results.pack(side=tk.TOP, fill=tk.X, before=self.tree)
+
+    def clear_search(self, event=None):
+        self.search_var.set('')
+        self.run_search()
+
+    def jump_to_first_match(self, event):
+        if self.results.size():
+            self.reveal(self.results.get(0))
+
+    def jump_to_selected_match(self, event):
+        selection = self.results.curselection()
+        if selection:
+            self.reveal(self.results.get(selection[0]))
+
+    def reveal(self, relative_path):
+        """Expand the folders leading to a path and scroll the tree to it."""
+        node_id = ''
+        for part in Path(relative_path).parts:
+            if self.tree.get_children(node_id) and not self.tree.item(self.tree.get_children(node_id)[0], 'text'):
+                self.expand_node(node_id)  # Folder still holds its placeholder
+            for child in self.tree.get_children(node_id):
+                if self.tree.item(child, 'text') == part:
+                    node_id = child
+                    break
+            else:
+                return  # Path no longer exists in the tree
+            self.tree.item(node_id, open=True)
+
+        self.tree.item(node_id, open=False)
+        self.tree.see(node_id)
+        self.tree.focus(node_id)
+
+    def get_full_path(self, node_id):
+        """Get full path of the selected node relative to the base folder."""
+        parts = []
+        while node_id:
+            node_text = self.tree.item(node_id, 'text')
+            parts.insert(0, node_text)
+            node_id = self.tree.parent(node_id)
+        return self.base_folder.joinpath(*parts)
+
+    def notify_selection_change(self, change):
+        """Trigger the callback if provided, pass view name for identification."""
+        if self.on_selection_change:
+            self.on_selection_change(self.view_name, change)
+
+    def get_selected_files(self):
+        """Return the set of user-selected files."""
+        return list(self.selected_files)
+
+    def select_items(self, file_paths):
+        """Programmatically select specific files based on their paths."""
+        self.selected_files.clear()
+        self.tree.selection_remove(self.tree.selection())  # Clear previous selections
+        selected = []
+
+        for file_path in file_paths:
+            # Get relative path to match nodes in the tree
+            relative_path = Path(file_path).relative_to(self.base_folder)
+
+            # Find and select the corresponding item in the tree
+            current_node = ''
+            for part in relative_path.parts:
+                for child in self.tree.get_children(current_node):
+                    if self.tree.item(child, 'text') == part:
+                        current_node = child
+                        break
+
+            # If a valid file was found, select it
+            if current_node:
+                self.selected_files.add(self.base_folder / relative_path)
+                self.tree.selection_add(current_node)
+                selected.append(self.base_folder / relative_path)
+
+        # Consumers building state from deltas have to start over
+        self.notifier.reset(selected)
+
+
+# Main Application Window
+class Application(tk.Tk):
+    def __init__(self):
+        super().__init__()
+
+        self.title("File Browser Application")
+        self.geometry('800x600')
+
+        # Left panel with Listbox and Quit button
+        left_frame = ttk.Frame(self)
+        left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
+
+        self.listbox = tk.Listbox(left_frame)
+        self.listbox.pack(side=tk.TOP, fill=tk.Y, expand=True)
+
+        # Add ranges to the listbox
+        for i in range(1, 41):
+            self.listbox.insert(tk.END, f'Range {i}')
+
+        # Quit button
+        quit_button = ttk.Button(left_frame, text='Quit', command=self.quit)
+        quit_button.pack(side=tk.BOTTOM, fill=tk.X, pady=10)
+
+        # Right panel with FileTreeView frames
+        right_frame = ttk.Frame(self)
+        right_frame.pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
+
+        # File view 1 (Link Files with custom heading)
+        self.link_files_view = FileTreeView(right_frame, '/Users/mikekriege/EMC/Factors', heading='Link Files',
+                                            on_selection_change=self.on_file_selection_change, view_name='Link Files',
+                                            show_metadata=True)
+
+        # File view 2 (Limits with custom heading)
+        self.limits_view = FileTreeView(right_frame, '/Users/mikekriege/EMC/Limits', heading='Limits',
+                                        on_selection_change=self.on_file_selection_change, view_name='Limits',
+                                        show_metadata=True)
+
+    @staticmethod
+    def on_file_selection_change(view_name, change):
+        """Handle file selection changes in FileTreeView."""
+        if change.reset:
+            print(f"Selection replaced in {view_name}: {list(change.added)}")
+            return
+        print(f"Selection changed in {view_name}: added {list(change.added)}, removed {list(change.removed)}")
+        # Only the change is passed; call get_selected_files() on the view for the full list
+
+
+# Run the application
+if __name__ == '__main__':
+    app = Application()
+    app.mainloop()
@@ -0,0 +1,131 @@
+import tkinter
+from typing import Any, ClassVar, NamedTuple
+from tkinter import Frame, Label, Entry, Button, Checkbutton, Variable, Widget
+
+# Tk command creating each supported widget class
+TCL_COMMANDS: dict[type, str] = {
+    Label: "label",
+    Entry: "entry",
+    Button: "button",
+    Checkbutton: "checkbutton",
+}
+
+
+# The two helpers below rely on private parts of tkinter, `_stringify` and
+# `BaseWidget._setup`. They have been stable across Python 3 releases but are not
+# part of its API, so check them first when a new Python version breaks forms.
+
+
+def tcl_quote(value: Any) -> str:
+    """Quotes a Python value as one Tcl word, the way tkinter quotes widget options."""
+    if isinstance(value, bool):
+        # `_stringify` gives "True"; tkinter passes bools to Tcl as 1 and 0, which is
+        # also what a `BooleanVar` stores
+        return "1" if value else "0"
+    return tkinter._stringify(value)  # type: ignore[attr-defined]
+
+
+def adopt_widget(cls: type, master: Widget, name: str, command: str) -> Widget:
+    """Returns a `cls` object for the widget `name` of `master` created by Tcl code.
+
+    The object is set up as the widget's constructor would, without creating it again.
+    """
+    widget = cls.__new__(cls)
+    widget.widgetName = command
+    widget._setup(master, {"name": name})  # BaseWidget._setup, private
+    return widget
+
+
+class FormWidget(NamedTuple):
+    """Declaration of one widget of a `FormView`.
+
+    Attributes:
+        name (str): Attribute the widget is exposed as. Also used as its Tk name.
+        widget (type): Widget class, one of the keys of `TCL_COMMANDS`.
+        options (dict): Widget options. The `variable` option names an entry of the
+            form's `variables`.
+        grid (dict): Options passed to `grid`.
+    """
+
+    name: str
+    widget: type
+    options: dict[str, Any]
+    grid: dict[str, Any]
+
+
+class FormView(Frame):
+    """Frame whose widgets are declared instead of built one call at a time.
+
+    Creating and gridding widgets from Python costs one Python→Tcl round-trip per call.
+    A form class instead lists its widgets in `widgets`; the first time the class is
+    built the list is compiled into a Tcl procedure, and every frame of that class is
+    then created with a single call to it. The widgets are still available as
+    attributes named after their declaration, just as if they were created from Python.
+
+    Class attributes:
+        columns (dict): Column index -> weight for `grid_columnconfigure`.
+        variables (dict): Attribute name -> `Variable` class created for the form.
+        widgets (tuple): The `FormWidget` declarations, in creation order.
+    """
+
+    columns: ClassVar[dict[int, int]] = {}
+    variables: ClassVar[dict[str, type]] = {}
+    widgets: ClassVar[tuple[FormWidget, ...]] = ()
+
+    _compiled: ClassVar[dict[type, tuple[str, str]]] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        names = []
+        for name, Var in self.variables.items():
+            variable: Variable = Var(self)
+            setattr(self, name, variable)
+            names.append(str(variable))
+
+        proc, script = self._compile()
+        self.tk.eval(f"{script}\n{proc} {self._w} {' '.join(names)}")
+
+        for spec in self.widgets:
+            setattr(self, spec.name, self._wrap(spec))
+
+    @classmethod
+    def _compile(cls) -> tuple[str, str]:
+        """Returns the procedure name and the script defining it, compiled once per class."""
+        try:
+            return cls._compiled[cls]
+        except KeyError:
+            pass
+
+        proc = f"::form::{cls.__module__}.{cls.__qualname__}"
+        args = " ".join(["w", *cls.variables])
+        lines = []
+        for column, weight in cls.columns.items():
+            lines.append(f"grid columnconfigure $w {column} -weight {weight}")
+        for spec in cls.widgets:
+            options = []
+            for key, value in spec.options.items():
+                value = f"${value}" if key == "variable" else tcl_quote(value)
+                options.append(f"-{key} {value}")
+            lines.append(
+                f"{TCL_COMMANDS[spec.widget]} $w.{spec.name} {' '.join(options)}".rstrip()
+            )
+        for spec in cls.widgets:
+            grid = " ".join(
+                f"-{key} {tcl_quote(value)}" for key, value in spec.grid.items()
+            )
+            lines.append(f"grid $w.{spec.name} {grid}")
+
+        body = "\n    ".join(lines)
+        # Defined on first use in every interpreter, later builds only call it
+        script = (
+            f"if {{[info commands {proc}] eq {{}}}} {{\n"
+            f"  namespace eval ::form {{}}\n"
+            f"  proc {proc} {{{args}}} {{\n    {body}\n  }}\n}}"
+        )
+        cls._compiled[cls] = (proc, script)
+        return proc, script
+
+    def _wrap(self, spec: FormWidget) -> Widget:
+        """Creates the Python object for a widget that already exists in Tcl."""
+        return adopt_widget(spec.widget, self, spec.name, TCL_COMMANDS[spec.widget])
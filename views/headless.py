@@ -0,0 +1,300 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+from tkinter import END, Label, Entry, Button, Checkbutton
+
+from .init_view import Factory, View
+from .form import FormView
+from .signin import SignInView
+from .signup import SignUpView
+
+Index = Union[int, str]
+
+
+class HeadlessRoot:
+    """Pure Python stand-in for the root window.
+
+    Callbacks scheduled with `after` and `after_idle` are queued instead of run by a Tk
+    event loop. They run when the driver calls `update`, which only runs the callbacks
+    that are due, or `drain`, which runs everything queued without waiting for timers,
+    so a test or benchmark is not slowed down by the delays the GUI uses.
+
+    `after` can be called from any thread, like Tk's.
+    """
+
+    def __init__(self):
+        self.children: dict[str, Any] = {}
+        self._queue: list[tuple[float, int, str]] = []
+        self._callbacks: dict[str, tuple[Callable, tuple]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def after(self, ms: int, func: Callable, *args: Any) -> str:
+        with self._lock:
+            seq = next(self._ids)
+            job = f"after#{seq}"
+            self._callbacks[job] = (func, args)
+            heapq.heappush(self._queue, (time.monotonic() + ms / 1000, seq, job))
+        return job
+
+    def after_idle(self, func: Callable, *args: Any) -> str:
+        return self.after(0, func, *args)
+
+    def after_cancel(self, job: str) -> None:
+        with self._lock:
+            self._callbacks.pop(job, None)
+
+    def update(self) -> int:
+        """Runs the callbacks that are due. Returns the number of callbacks run."""
+        return self._run(time.monotonic())
+
+    def update_idletasks(self) -> int:
+        return self.update()
+
+    def drain(self, limit: int = 1_000_000) -> int:
+        """Runs queued callbacks, including ones they schedule, until none are left.
+
+        Timers are not waited for. Returns the number of callbacks run.
+
+        Raises:
+            RuntimeError: If more than `limit` callbacks run, e.g. a callback that
+                always schedules itself again.
+        """
+        count = 0
+        while self._queue:
+            count += self._run(float("inf"))
+            if count > limit:
+                raise RuntimeError(
+                    f"More than {limit} callbacks, the queue never drains"
+                )
+        return count
+
+    def _run(self, now: float) -> int:
+        count = 0
+        while True:
+            with self._lock:
+                if not self._queue or self._queue[0][0] > now:
+                    return count
+                _, _, job = heapq.heappop(self._queue)
+                callback = self._callbacks.pop(job, None)
+            if callback is not None:
+                func, args = callback
+                func(*args)
+                count += 1
+
+    def bind(self, sequence: str, func: Callable, add: Optional[str] = None) -> None:
+        pass
+
+    def mainloop(self) -> None:
+        """Runs what is already queued and returns, there is no event loop to enter."""
+        self.update()
+
+    def quit(self) -> None:
+        pass
+
+    def destroy(self) -> None:
+        with self._lock:
+            self._queue.clear()
+            self._callbacks.clear()
+
+
+class HeadlessWidget:
+    """Widget keeping its options in a dict; layout and focus calls do nothing."""
+
+    def __init__(self, master: Any = None, **options: Any):
+        self.master = master
+        self.options: dict[str, Any] = dict(options)
+        self.children: dict[str, Any] = {}
+        self.mapped = False
+        if master is not None:
+            master.children[str(id(self))] = self
+
+    def configure(self, **options: Any) -> None:
+        self.options.update(options)
+
+    config = configure
+
+    def cget(self, key: str) -> Any:
+        return self.options.get(key, "")
+
+    def __getitem__(self, key: str) -> Any:
+        return self.cget(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.configure(**{key: value})
+
+    def after(self, ms: int, func: Callable, *args: Any) -> str:
+        return self.master.after(ms, func, *args)
+
+    def grid(self, **options: Any) -> None:
+        self.mapped = True
+
+    def grid_remove(self) -> None:
+        self.mapped = False
+
+    pack = place = grid
+    grid_forget = pack_forget = grid_remove
+
+    def grid_columnconfigure(self, index: int, **options: Any) -> None:
+        pass
+
+    def tkraise(self) -> None:
+        pass
+
+    lift = lower = tkraise
+
+    def focus(self) -> None:
+        pass
+
+    def bind(self, sequence: str, func: Callable, add: Optional[str] = None) -> None:
+        pass
+
+    def winfo_children(self) -> list[Any]:
+        return list(self.children.values())
+
+    def destroy(self) -> None:
+        for child in self.winfo_children():
+            child.destroy()
+        if self.master is not None:
+            self.master.children.pop(str(id(self)), None)
+
+
+class HeadlessLabel(HeadlessWidget):
+    pass
+
+
+class HeadlessEntry(HeadlessWidget):
+    """Entry whose text is a Python string."""
+
+    def __init__(self, master: Any = None, **options: Any):
+        super().__init__(master, **options)
+        self.text = ""
+
+    def _index(self, index: Index) -> int:
+        if index == END:
+            return len(self.text)
+        return min(int(index), len(self.text))
+
+    def get(self) -> str:
+        return self.text
+
+    def insert(self, index: Index, string: str) -> None:
+        i = self._index(index)
+        self.text = self.text[:i] + string + self.text[i:]
+
+    def delete(self, first: Index, last: Optional[Index] = None) -> None:
+        start = self._index(first)
+        end = start + 1 if last is None else self._index(last)
+        self.text = self.text[:start] + self.text[end:]
+
+
+class HeadlessButton(HeadlessWidget):
+    def invoke(self) -> Any:
+        """Calls the button's command, as a click would."""
+        command = self.options.get("command")
+        if command and self.options.get("state") != "disabled":
+            return command()
+
+
+class HeadlessVariable:
+    def __init__(self, master: Any = None, value: Any = None):
+        self.value = value
+
+    def get(self) -> Any:
+        return self.value
+
+    def set(self, value: Any) -> None:
+        self.value = value
+
+
+class HeadlessCheckbutton(HeadlessButton):
+    def invoke(self) -> Any:
+        variable = self.options.get("variable")
+        if variable is not None:
+            variable.set(not variable.get())
+        return super().invoke()
+
+
+# Tk widget class -> its headless stand-in
+HEADLESS_WIDGETS: dict[type, type] = {
+    Label: HeadlessLabel,
+    Entry: HeadlessEntry,
+    Button: HeadlessButton,
+    Checkbutton: HeadlessCheckbutton,
+}
+
+
+class HeadlessForm(HeadlessWidget):
+    """Headless frame built from the declarations of a `FormView` class.
+
+    The widgets and variables get the attribute names of the form, so a controller
+    cannot tell the difference.
+    """
+
+    def __init__(self, form: type[FormView], master: Any = None):
+        super().__init__(master)
+        for name in form.variables:
+            setattr(self, name, HeadlessVariable(self, value=False))
+        for spec in form.widgets:
+            options = dict(spec.options)
+            if "variable" in options:
+                options["variable"] = getattr(self, options["variable"])
+            setattr(self, spec.name, HEADLESS_WIDGETS[spec.widget](self, **options))
+
+
+class HeadlessHomeView(HeadlessWidget):
+    """Headless `HomeView`."""
+
+    def __init__(self, master: Any = None):
+        super().__init__(master)
+        self.header = HeadlessLabel(self, text="Home")
+        self.greeting = HeadlessLabel(self, text="")
+        self.signout_btn = HeadlessButton(self, text="Sign Out")
+
+
+class HeadlessView(View):
+    """`View` whose root and frames are pure Python, so no display is needed.
+
+    Controllers and models are driven exactly as with the real view, e.g. by setting
+    entry text and calling `invoke` on buttons, at the speed of plain Python calls.
+    Scheduled callbacks, like the flushes of `updates`, run on `root.update()` or
+    `root.drain()`; `start_mainloop` runs what is due and returns right away.
+    """
+
+    # Factory of the real frame -> factory of its headless stand-in
+    FRAMES: dict[Factory, Callable[[Any], Any]] = {
+        "views.signup:SignUpView": lambda master: HeadlessForm(SignUpView, master),
+        "views.signin:SignInView": lambda master: HeadlessForm(SignInView, master),
+        "views.home:HomeView": HeadlessHomeView,
+    }
+
+    def _create_root(self) -> HeadlessRoot:  # type: ignore[override]
+        return HeadlessRoot()
+
+    def register_frame(self, name: str, factory: Factory) -> None:
+        super().register_frame(name, self.FRAMES.get(factory, factory))
+
+    @staticmethod
+    def _snapshot(frame: Any) -> dict[str, Any]:
+        state = {}
+        for attr, value in vars(frame).items():
+            if isinstance(value, HeadlessEntry) and value.cget("show"):
+                continue  # Masked input, see View._snapshot
+            if isinstance(value, (HeadlessEntry, HeadlessVariable)):
+                state[attr] = value.get()
+        return state
+
+    @staticmethod
+    def _restore(frame: Any, state: dict[str, Any]) -> None:
+        for attr, value in state.items():
+            widget = getattr(frame, attr, None)
+            if isinstance(widget, HeadlessEntry):
+                widget.delete(0, END)
+                widget.insert(0, value)
+            elif isinstance(widget, HeadlessVariable):
+                widget.set(value)
+
+    def start_mainloop(self) -> None:
+        self.root.mainloop()
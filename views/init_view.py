@@ -1,33 +1,280 @@
-from typing import TypedDict
+import importlib
+import sys
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypedDict, Union
+from tkinter import Frame, Entry, Variable, Misc, END
 
 from .root import Root
-from .home import HomeView
-from .signin import SignInView
-from .signup import SignUpView
+from .updates import UpdateScheduler
 
+if TYPE_CHECKING:
+    from .home import HomeView
+    from .signin import SignInView
+    from .signup import SignUpView
 
-class Frames(TypedDict):
-    signup: SignUpView
-    signin: SignInView
-    home: HomeView
+# A callable, or the "module:attribute" path of one to import when first needed
+Factory = Union[str, Callable[..., Any]]
+
+
+def import_factory(factory: Factory) -> Callable[..., Any]:
+    """Returns the factory, importing it first if it is given as "module:attribute"."""
+    if not isinstance(factory, str):
+        return factory
+    module, _, attribute = factory.partition(":")
+    return getattr(importlib.import_module(module), attribute)
+
+
+class Frames(TypedDict, total=False):
+    signup: "SignUpView"
+    signin: "SignInView"
+    home: "HomeView"
+
+
+class FrameStats(TypedDict):
+    state: str
+    widgets: int
+    snapshot_bytes: int
 
 
 class View:
-    def __init__(self):
-        self.root = Root()
+    def __init__(
+        self,
+        max_live_frames: Optional[int] = None,
+        hibernate_after: Optional[float] = None,
+        switch_mode: str = "raise",
+    ):
+        """
+        Args:
+            max_live_frames (int, optional): Number of built frames to keep. The least
+                recently shown frames beyond this are hibernated. None keeps all.
+            hibernate_after (float, optional): Seconds after which a frame that has not
+                been shown is hibernated. None disables the time limit.
+            switch_mode (str): "raise" keeps every frame gridded and raises the shown
+                one. "unmap" removes hidden frames from the grid so window resizes only
+                lay out the visible frame.
+        """
+        if switch_mode not in ("raise", "unmap"):
+            raise ValueError(f"Unknown switch mode: {switch_mode}")
+
+        self.root = self._create_root()
         self.frames: Frames = {}  # type: ignore
+        self.updates = UpdateScheduler(self.root)
+        self.max_live_frames = max_live_frames
+        self.hibernate_after = hibernate_after
+        self.switch_mode = switch_mode
+        self.current: Optional[str] = None
+        self._factories: dict[str, Factory] = {}
+        self._frame_listeners: dict[str, list[Callable[[Any], None]]] = {}
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._last_shown: OrderedDict[str, float] = OrderedDict()
+        self._built: dict[str, float] = {}
+        self._resize_listeners: list[Callable[[int, int], None]] = []
+        self._resize_job: Optional[str] = None
+        self._size = (0, 0)
+        self.root.bind("<Configure>", self._on_configure)
+
+        self.register_frame("signup", "views.signup:SignUpView")
+        self.register_frame("signin", "views.signin:SignInView")
+        self.register_frame("home", "views.home:HomeView")
+
+    def _create_root(self) -> Root:
+        return Root()
 
-        self._add_frame(SignUpView, "signup")
-        self._add_frame(SignInView, "signin")
-        self._add_frame(HomeView, "home")
+    def register_frame(self, name: str, factory: Factory) -> None:
+        """Registers a frame factory without building the frame.
+
+        The frame is built the first time it is requested with `get_frame` or shown
+        with `switch`, so startup only pays for the frames that are actually used.
+        A factory given as "module:Class" also defers importing its module until then.
+
+        Args:
+            name (str): Name used to switch to the frame.
+            factory (function or str): Called with the root window, returns the frame.
+        """
+        self._factories[name] = factory
+
+    def add_frame_listener(self, name: str, fn: Callable[[Any], None]) -> Callable:
+        """Registers a callback for every time the frame `name` is built.
+
+        Frames can be destroyed by hibernation and built again later, so anything that
+        keeps references to a frame's widgets, like button commands bound by a
+        controller, has to be set up from this callback. If the frame is already built
+        the callback is called right away.
+
+        Args:
+            name (str): Name of the frame.
+            fn (function): Called with the newly built frame.
+
+        Returns:
+            function: Function to remove the listener.
+        """
+        self._frame_listeners.setdefault(name, []).append(fn)
+        if name in self.frames:
+            fn(self.frames[name])
+        return lambda: self._frame_listeners[name].remove(fn)
+
+    def get_frame(self, name: str) -> Frame:
+        """Returns the frame registered under `name`, building it on first use."""
+        if name not in self.frames:
+            factory = self._factories[name] = import_factory(self._factories[name])
+            self._add_frame(factory, name)
+        return self.frames[name]
 
     def _add_frame(self, Frame, name: str) -> None:
         self.frames[name] = Frame(self.root)
+        self._built[name] = time.monotonic()
         self.frames[name].grid(row=0, column=0, sticky="nsew")
+        # Frames built in the background must not cover the one currently shown
+        if self.switch_mode == "unmap":
+            self.frames[name].grid_remove()
+        else:
+            self.frames[name].lower()
+
+        if name in self._snapshots:
+            self._restore(self.frames[name], self._snapshots.pop(name))
+        # Copy, listeners may register more listeners for this frame
+        for fn in list(self._frame_listeners.get(name, [])):
+            fn(self.frames[name])
+
+    def prewarm(self, *names: str) -> None:
+        """Builds frames that are likely to be shown next while the GUI is idle.
+
+        One frame is built per idle callback so pending user input is handled in
+        between.
+        """
+        pending = [name for name in names if name not in self.frames]
+        if pending:
+            self.root.after_idle(self._prewarm_next, pending)
+
+    def _prewarm_next(self, pending: list[str]) -> None:
+        name = pending.pop(0)
+        if name not in self.frames:
+            self.get_frame(name)
+        if pending:
+            self.root.after_idle(self._prewarm_next, pending)
 
     def switch(self, name: str) -> None:
-        frame = self.frames[name]
-        frame.tkraise()
+        frame = self.get_frame(name)
+        if self.switch_mode == "unmap":
+            if self.current in self.frames and self.current != name:
+                self.frames[self.current].grid_remove()  # type: ignore
+            frame.grid()
+        else:
+            frame.tkraise()
+        self.current = name
+
+        self._last_shown[name] = time.monotonic()
+        self._last_shown.move_to_end(name)
+        self._hibernate_inactive(current=name)
+
+    def hibernate(self, name: str) -> None:
+        """Destroys a frame's widgets, keeping its form input for when it is rebuilt."""
+        frame = self.frames.pop(name)  # type: ignore
+        self._snapshots[name] = self._snapshot(frame)
+        self._last_shown.pop(name, None)
+        self._built.pop(name, None)
+        frame.destroy()
+
+    def discard_snapshot(self, name: str) -> None:
+        """Forgets the input kept for a hibernated frame, so it is rebuilt empty."""
+        self._snapshots.pop(name, None)
+
+    def _hibernate_inactive(self, current: str) -> None:
+        """Hibernates the least recently shown frames that exceed the configured limits."""
+        never_shown = [name for name in self.frames if name not in self._last_shown]
+        live = never_shown + [name for name in self._last_shown if name != current]
+        if self.hibernate_after is not None:
+            deadline = time.monotonic() - self.hibernate_after
+            for name in live:
+                # Frames never shown, e.g. prewarmed ones, count from when they were built
+                if self._last_shown.get(name, self._built[name]) < deadline:
+                    self.hibernate(name)
+            live = [name for name in live if name in self.frames]
+        if self.max_live_frames is not None:
+            excess = len(self.frames) - self.max_live_frames
+            for name in live[: max(excess, 0)]:
+                self.hibernate(name)
+
+    def add_resize_listener(self, fn: Callable[[int, int], None]) -> Callable:
+        """Registers a callback for window resizes.
+
+        A window drag produces a burst of `<Configure>` events; listeners are called
+        once with the final width and height when the GUI becomes idle instead of once
+        per event.
+
+        Returns:
+            function: Function to remove the listener.
+        """
+        self._resize_listeners.append(fn)
+        return lambda: self._resize_listeners.remove(fn)
+
+    def _on_configure(self, event) -> None:
+        # Configure events of every child widget propagate to the root's bindings
+        if event.widget is not self.root or (event.width, event.height) == self._size:
+            return
+        self._size = (event.width, event.height)
+        if self._resize_job is None:
+            self._resize_job = self.root.after_idle(self._dispatch_resize)
+
+    def _dispatch_resize(self) -> None:
+        self._resize_job = None
+        for fn in self._resize_listeners:
+            fn(*self._size)
+
+    @staticmethod
+    def _snapshot(frame: Frame) -> dict[str, Any]:
+        """Collects the values of the entries and variables held as frame attributes.
+
+        Entries that mask their input, like password fields, are left out so their
+        text is not kept once the frame is destroyed.
+        """
+        state = {}
+        for attr, value in vars(frame).items():
+            if isinstance(value, Entry) and value.cget("show"):
+                continue
+            if isinstance(value, (Entry, Variable)):
+                state[attr] = value.get()
+        return state
+
+    @staticmethod
+    def _restore(frame: Frame, state: dict[str, Any]) -> None:
+        for attr, value in state.items():
+            widget = getattr(frame, attr, None)
+            if isinstance(widget, Entry):
+                widget.delete(0, END)
+                widget.insert(0, value)
+            elif isinstance(widget, Variable):
+                widget.set(value)
+
+    def frame_stats(self) -> dict[str, FrameStats]:
+        """Reports the memory held by every registered frame.
+
+        Live frames are measured by their number of Tk widgets, hibernated frames by
+        the size of their snapshot.
+        """
+        stats: dict[str, FrameStats] = {}
+        for name in self._factories:
+            if name in self.frames:
+                widgets = self._count_widgets(self.frames[name])  # type: ignore
+                stats[name] = {"state": "live", "widgets": widgets, "snapshot_bytes": 0}
+            elif name in self._snapshots:
+                size = sum(sys.getsizeof(v) for v in self._snapshots[name].values())
+                stats[name] = {
+                    "state": "hibernated",
+                    "widgets": 0,
+                    "snapshot_bytes": size,
+                }
+            else:
+                stats[name] = {"state": "not built", "widgets": 0, "snapshot_bytes": 0}
+        return stats
+
+    @staticmethod
+    def _count_widgets(widget: Misc) -> int:
+        count = 1
+        for child in widget.winfo_children():
+            count += View._count_widgets(child)
+        return count
 
     def start_mainloop(self) -> None:
         self.root.mainloop()
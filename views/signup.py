@@ -1,45 +1,108 @@
-from tkinter import Frame, Label, Entry, Checkbutton, Button, BooleanVar
+from tkinter import Label, Entry, Checkbutton, Button, BooleanVar
 
+from .form import FormView, FormWidget
 
-class SignUpView(Frame):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
 
-        self.grid_columnconfigure(0, weight=0)
-        self.grid_columnconfigure(1, weight=1)
+class SignUpView(FormView):
+    header: Label
+    fullname_label: Label
+    fullname_input: Entry
+    username_label: Label
+    username_input: Entry
+    username_status: Label
+    password_label: Label
+    password_input: Entry
+    has_agreed: BooleanVar
+    agreement: Checkbutton
+    message: Label
+    signup_btn: Button
+    signin_option_label: Label
+    signin_btn: Button
 
-        self.header = Label(self, text="Create a new account")
-        self.header.grid(row=0, column=0, columnspan=2, padx=10, pady=10)
-
-        self.fullname_label = Label(self, text="Full Name")
-        self.fullname_input = Entry(self)
-        self.fullname_label.grid(row=1, column=0, padx=10, sticky="w")
-        self.fullname_input.grid(row=1, column=1, padx=(0, 20), sticky="ew")
-
-        self.username_label = Label(self, text="Username")
-        self.username_input = Entry(self)
-        self.username_label.grid(row=2, column=0, padx=10, sticky="w")
-        self.username_input.grid(row=2, column=1, padx=(0, 20), sticky="ew")
-
-        self.password_label = Label(self, text="Password")
-        self.password_input = Entry(self, show="*")
-        self.password_label.grid(row=3, column=0, padx=10, sticky="w")
-        self.password_input.grid(row=3, column=1, padx=(0, 20), sticky="ew")
-
-        self.has_agreed = BooleanVar()
-        self.agreement = Checkbutton(
-            self,
-            text="I've agreed to the Terms & Conditions",
-            variable=self.has_agreed,
-            onvalue=True,
-            offvalue=False,
-        )
-        self.agreement.grid(row=4, column=1, padx=0, sticky="w")
-
-        self.signup_btn = Button(self, text="Sign Up")
-        self.signup_btn.grid(row=5, column=1, padx=0, pady=10, sticky="w")
-
-        self.signin_option_label = Label(self, text="Already have an account?")
-        self.signin_btn = Button(self, text="Sign In")
-        self.signin_option_label.grid(row=6, column=1, sticky="w")
-        self.signin_btn.grid(row=7, column=1, sticky="w")
+    columns = {0: 0, 1: 1}
+    variables = {"has_agreed": BooleanVar}
+    widgets = (
+        FormWidget(
+            "header",
+            Label,
+            {"text": "Create a new account"},
+            {"row": 0, "column": 0, "columnspan": 2, "padx": 10, "pady": 10},
+        ),
+        FormWidget(
+            "fullname_label",
+            Label,
+            {"text": "Full Name"},
+            {"row": 1, "column": 0, "padx": 10, "sticky": "w"},
+        ),
+        FormWidget(
+            "fullname_input",
+            Entry,
+            {},
+            {"row": 1, "column": 1, "padx": (0, 20), "sticky": "ew"},
+        ),
+        FormWidget(
+            "username_label",
+            Label,
+            {"text": "Username"},
+            {"row": 2, "column": 0, "padx": 10, "sticky": "w"},
+        ),
+        FormWidget(
+            "username_input",
+            Entry,
+            {},
+            {"row": 2, "column": 1, "padx": (0, 20), "sticky": "ew"},
+        ),
+        FormWidget(
+            "username_status",
+            Label,
+            {"text": ""},
+            {"row": 3, "column": 1, "sticky": "w"},
+        ),
+        FormWidget(
+            "password_label",
+            Label,
+            {"text": "Password"},
+            {"row": 4, "column": 0, "padx": 10, "sticky": "w"},
+        ),
+        FormWidget(
+            "password_input",
+            Entry,
+            {"show": "*"},
+            {"row": 4, "column": 1, "padx": (0, 20), "sticky": "ew"},
+        ),
+        FormWidget(
+            "agreement",
+            Checkbutton,
+            {
+                "text": "I've agreed to the Terms & Conditions",
+                "variable": "has_agreed",
+                "onvalue": True,
+                "offvalue": False,
+            },
+            {"row": 5, "column": 1, "padx": 0, "sticky": "w"},
+        ),
+        FormWidget(
+            "message",
+            Label,
+            {"text": "", "fg": "red"},
+            {"row": 6, "column": 1, "sticky": "w"},
+        ),
+        FormWidget(
+            "signup_btn",
+            Button,
+            {"text": "Sign Up"},
+            {"row": 7, "column": 1, "padx": 0, "pady": 10, "sticky": "w"},
+        ),
+        FormWidget(
+            "signin_option_label",
+            Label,
+            {"text": "Already have an account?"},
+            {"row": 8, "column": 1, "sticky": "w"},
+        ),
+        FormWidget(
+            "signin_btn",
+            Button,
+            {"text": "Sign In"},
+            {"row": 9, "column": 1, "sticky": "w"},
+        ),
+    )
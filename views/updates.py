@@ -0,0 +1,98 @@
+import threading
+import weakref
+from typing import Any, Optional
+from tkinter import Misc, TclError
+
+
+class UpdateScheduler:
+    """Coalesces widget option changes into one batch of Tk calls per frame.
+
+    Controllers record the option values they want a widget to show with `set`. The
+    values are applied together on the next flush, at most once every `interval_ms`,
+    so a label updated many times between two paints is only configured once, and
+    values equal to what was last applied are not sent to Tk at all.
+
+    `set` can also be called from worker threads such as model tasks, as long as the
+    thread is registered with `watch`: Tk may only be called from its own thread, so
+    the changes of other threads are picked up by a poll on the main loop.
+    """
+
+    def __init__(self, root: Misc, interval_ms: int = 16):
+        self.root = root
+        self.interval_ms = interval_ms
+        self._pending: dict[Misc, dict[str, Any]] = {}
+        self._applied: "weakref.WeakKeyDictionary[Misc, dict[str, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._job: Optional[str] = None
+        self._tk_thread = threading.get_ident()
+        self._watched: list[threading.Thread] = []
+
+    def set(self, widget: Misc, **options: Any) -> None:
+        """Records the option values the widget should have after the next flush."""
+        on_tk_thread = threading.get_ident() == self._tk_thread
+        if not on_tk_thread and threading.current_thread() not in self._watched:
+            raise RuntimeError(
+                "UpdateScheduler.set called from a thread that is not watched"
+            )
+        with self._lock:
+            pending = self._pending.get(widget)
+            if pending is None:
+                applied = self._applied.get(widget, {})
+                if all(
+                    key in applied and applied[key] == value
+                    for key, value in options.items()
+                ):
+                    return  # Nothing would change
+                pending = self._pending[widget] = {}
+            pending.update(options)
+
+        # Other threads leave the flush to the poll started by `watch`
+        if on_tk_thread and self._job is None:
+            self._job = self.root.after(self.interval_ms, self.flush)
+
+    def watch(self, thread: threading.Thread) -> None:
+        """Applies the changes `thread` records until it ends.
+
+        Call from the Tk thread, before starting the thread.
+        """
+        self._watched.append(thread)
+        if len(self._watched) == 1:
+            self.root.after(self.interval_ms, self._poll)
+
+    def _poll(self) -> None:
+        # Threads not started yet are kept, see `watch`
+        self._watched = [t for t in self._watched if t.is_alive() or t.ident is None]
+        if self._pending:
+            self.flush()
+        if self._watched:
+            self.root.after(self.interval_ms, self._poll)
+
+    def flush(self) -> None:
+        """Applies all recorded changes now."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._job = None
+
+        for widget, options in pending.items():
+            applied = self._applied.setdefault(widget, {})
+            changed = {
+                key: value
+                for key, value in options.items()
+                if key not in applied or applied[key] != value
+            }
+            if changed:
+                try:
+                    widget.configure(**changed)
+                except TclError:
+                    if widget.winfo_exists():
+                        raise  # E.g. an unknown option name
+                    continue  # The widget was destroyed since the change was recorded
+                applied.update(changed)
+
+    def forget(self, widget: Misc) -> None:
+        """Drops the cached values of a widget that was reconfigured directly."""
+        with self._lock:
+            self._pending.pop(widget, None)
+            self._applied.pop(widget, None)